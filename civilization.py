@@ -7,10 +7,13 @@ Gère l'émergence et l'évolution des civilisations issues d'espèces intellige
 """
 
 import random
+import bisect
+import itertools
 import numpy as np
 import logging
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque, namedtuple
+from simulation.jit import HAS_NUMBA, njit
 
 class TechLevel(Enum):
     """Niveaux technologiques possibles pour une civilisation."""
@@ -34,6 +37,287 @@ class GovernmentType(Enum):
     HIVE_MIND = 6
     AI_GOVERNANCE = 7
 
+# Événement de l'historique d'une civilisation
+HistoryEvent = namedtuple("HistoryEvent", ["year", "type", "description"])
+
+# Nombre maximal d'événements conservés dans l'historique d'une civilisation
+_HISTORY_LENGTH = 1000
+
+# Cadence (en années) des mises à jour territoriales et diplomatiques
+# des civilisations isolées et peu actives
+_QUIET_UPDATE_INTERVAL = 5
+
+# Niveaux technologiques indexés par leur valeur
+_TECH_BY_INDEX = tuple(TechLevel)
+
+# Types de gouvernement possibles
+_ALL_GOVERNMENTS = tuple(GovernmentType)
+
+# Multiplicateurs de vulnérabilité aux catastrophes globales, indexés par niveau technologique
+_CATASTROPHE_MULTIPLIERS = {
+    # Météorite: moins d'effet sur les civilisations spatiales (niveau 5+)
+    "meteorite": np.array([1.0, 1.0, 1.0, 1.0, 1.0, 0.5, 0.5, 0.5]),
+    # Éruption volcanique: moins d'effet sur les civilisations avancées (niveau 4+)
+    "supervolcano": np.array([1.0, 1.0, 1.0, 1.0, 0.7, 0.7, 0.7, 0.7]),
+    # Éruption solaire: plus d'effet sur les civilisations technologiques (niveau 3+)
+    "solar_flare": np.array([1.0, 1.0, 1.0, 1.3, 1.3, 1.3, 1.3, 1.3]),
+    # Pandémie: moins d'effet sur les civilisations médicalement avancées (niveau 4+)
+    "pandemic": np.array([1.0, 1.0, 1.0, 1.0, 0.6, 0.6, 0.6, 0.6])
+}
+
+# Modificateurs de croissance de la population, indexés par niveau technologique
+_TECH_MOD = np.array([0.005, 0.015, 0.01, 0.02, 0.015, 0.01, 0.005, 0.003])
+
+# Capacités de charge de base, indexées par niveau technologique
+_TECH_CAP = (10000, 100000, 1000000, 10000000, 100000000,
+             1000000000, 10000000000, 100000000000)
+
+# Technologies par niveau
+_TECH_DISCOVERIES = {
+    TechLevel.PRIMITIVE: ("Feu", "Outils en pierre", "Langage écrit"),
+    TechLevel.AGRICULTURAL: ("Agriculture", "Poterie", "Domestication", "Métallurgie de base"),
+    TechLevel.MEDIEVAL: ("Architecture", "Mathématiques", "Astronomie", "Navigation"),
+    TechLevel.INDUSTRIAL: ("Machine à vapeur", "Électricité", "Chimie", "Transport mécanisé"),
+    TechLevel.INFORMATION: ("Informatique", "Télécommunications", "Médecine avancée", "Énergie nucléaire"),
+    TechLevel.SPACE: ("Voyage spatial", "Robotique", "Intelligence artificielle", "Biotechnologie"),
+    TechLevel.ADVANCED: ("Manipulation génétique", "Nanotechnologie", "Fusion nucléaire", "Réalité virtuelle"),
+    TechLevel.STELLAR: ("Propulsion FTL", "Terraformation", "Conscience numérique", "Manipulation quantique")
+}
+
+# Bit associé à chaque technologie dans le masque Civilization.technologies
+_TECH_NAMES = tuple(tech for techs in _TECH_DISCOVERIES.values() for tech in techs)
+_TECH_BIT = {tech: 1 << i for i, tech in enumerate(_TECH_NAMES)}
+
+# Éléments utilisés pour générer les noms, langues et religions
+_NAME_PREFIXES = ("Ar", "Bel", "Civ", "Dor", "El", "Fal", "Gal", "Hy", "Il", "Jor",
+                  "Kal", "Lum", "Mer", "Neb", "Orb", "Prim", "Qua", "Rim", "Sol", "Ter")
+_NAME_SUFFIXES = ("ia", "or", "an", "ium", "aria", "alis", "oria", "ium", "aris", "on")
+_VOWELS = "aeiouy"
+_CONSONANTS = "bcdfghjklmnpqrstvwxz"
+_SYLLABLE_STRUCTURES = ("CV", "CVC", "VC", "CVVC")
+_RELIGION_TYPES = ("animisme", "polythéisme", "monothéisme", "dualisme", "philosophie naturelle")
+_RELIGION_FOCUSES = ("nature", "ancêtres", "astres", "éléments", "cycle de vie", "ordre cosmique")
+_RELIGION_PRACTICES = ("prière", "méditation", "sacrifice", "rituel", "pèlerinage", "jeûne")
+_DEITY_PREFIXES = ("Anu", "Bel", "Cro", "Dra", "Eos", "Fyr", "Gai", "Hel", "Ish", "Jor")
+_DEITY_SUFFIXES = ("os", "us", "a", "is", "ar", "on", "oth", "um", "ax", "ir")
+
+# Probabilité annuelle d'un événement aléatoire (5% par an)
+_EVENT_PROBABILITY = 0.05
+
+# Générateurs des événements aléatoires (culturel, politique, économique,
+# catastrophe, découverte) et leur distribution cumulée
+# (les catastrophes sont moins fréquentes). Avec cinq poids, une recherche
+# dichotomique est plus rapide qu'une table d'alias.
+_EVENT_HANDLERS = ("_generate_cultural_event", "_generate_political_event", "_generate_economic_event",
+                   "_generate_disaster_event", "_generate_discovery_event")
+_EVENT_CDF = tuple(itertools.accumulate((1, 1, 1, 0.5, 0.8)))
+_EVENT_TOTAL = _EVENT_CDF[-1]
+
+# Événements culturels et leurs effets sur les attributs de la civilisation
+_CULTURAL_EVENTS = {
+    "Âge d'or artistique": (("creativity", 0.1),),
+    "Révolution culturelle": (("stability", -0.1), ("creativity", 0.15)),
+    "Mouvement philosophique majeur": (("tech_progress", 0.05),),
+    "Réforme linguistique": (),  # Effet symbolique
+    "Festival traditionnel institutionnalisé": (("stability", 0.05),)
+}
+_CULTURAL_EVENT_NAMES = tuple(_CULTURAL_EVENTS)
+
+# Événements politiques, économiques et catastrophiques possibles
+_POLITICAL_EVENTS = ("Révolution", "Réforme gouvernementale", "Guerre civile", "Unification", "Sécession")
+_ECONOMIC_EVENTS = ("Boom économique", "Récession", "Découverte de ressources", "Innovation commerciale", "Famine")
+_DISASTER_EVENTS = ("Épidémie", "Catastrophe naturelle", "Accident technologique", "Conflit interne",
+                    "Crise environnementale")
+
+# Autres tables utilisées par les événements
+_ART_FOCUSES = ("visuel", "auditif", "conceptuel", "performatif")
+_FRIENDLY_RELATION_EVENTS = ("alliance", "traité commercial", "échange culturel")
+_HOSTILE_RELATION_EVENTS = ("conflit", "guerre", "embargo")
+_RESOURCES = ("minéraux", "énergie", "nourriture", "matériaux rares")
+
+# Tables utilisées par l'évolution de la société
+_WRITING_SYSTEMS = ("pictographique", "idéographique", "alphabétique")
+_INDUSTRIAL_GOVERNMENTS = (GovernmentType.REPUBLIC, GovernmentType.OLIGARCHY)
+_INFORMATION_GOVERNMENTS = (GovernmentType.DEMOCRACY, GovernmentType.TECHNOCRACY)
+_ADVANCED_GOVERNMENTS = (GovernmentType.TECHNOCRACY, GovernmentType.AI_GOVERNANCE)
+_SOCIAL_ATTRIBUTES = ("stability", "aggression", "cooperation", "creativity")
+_RELIGIOUS_CHANGES = ("réforme", "schisme", "syncrétisme")
+
+def _dilate(mask):
+    """
+    Dilate un masque booléen d'une cellule dans les 8 directions (grille torique).
+
+    Args:
+        mask: Masque booléen 2D.
+
+    Returns:
+        Le masque des cellules adjacentes à au moins une cellule du masque.
+    """
+    # Dilatation séparable: d'abord les lignes, puis les colonnes, par OU en place
+    # sur des tranches décalées (évite les copies temporaires de np.roll)
+    rows = mask.copy()
+    rows[1:] |= mask[:-1]
+    rows[0] |= mask[-1]
+    rows[:-1] |= mask[1:]
+    rows[-1] |= mask[0]
+    
+    dilated = rows.copy()
+    dilated[:, 1:] |= rows[:, :-1]
+    dilated[:, 0] |= rows[:, -1]
+    dilated[:, :-1] |= rows[:, 1:]
+    dilated[:, -1] |= rows[:, 0]
+    return dilated
+
+def _adjacent(mask):
+    """
+    Repère les cellules voisines d'un masque booléen dans les 8 directions (grille torique).
+
+    Args:
+        mask: Masque booléen 2D.
+
+    Returns:
+        Le masque des cellules dont au moins une des 8 voisines appartient au masque
+        (la cellule elle-même n'est pas prise en compte).
+    """
+    # Voisines des lignes adjacentes (dy = ±1), puis étendues aux colonnes adjacentes
+    vertical = np.zeros_like(mask)
+    vertical[1:] |= mask[:-1]
+    vertical[0] |= mask[-1]
+    vertical[:-1] |= mask[1:]
+    vertical[-1] |= mask[0]
+    
+    adjacent = vertical.copy()
+    adjacent[:, 1:] |= vertical[:, :-1]
+    adjacent[:, 0] |= vertical[:, -1]
+    adjacent[:, :-1] |= vertical[:, 1:]
+    adjacent[:, -1] |= vertical[:, 0]
+    
+    # Voisines de la même ligne (dx = ±1)
+    adjacent[:, 1:] |= mask[:, :-1]
+    adjacent[:, 0] |= mask[:, -1]
+    adjacent[:, :-1] |= mask[:, 1:]
+    adjacent[:, -1] |= mask[:, 0]
+    return adjacent
+
+def _dilate_profile(profile, radius):
+    """
+    Dilate un profil booléen 1D de radius cellules de part et d'autre (axe torique).
+    
+    Args:
+        profile: Masque booléen 1D (lignes ou colonnes occupées).
+        radius: Rayon de dilatation.
+    
+    Returns:
+        Le profil dilaté.
+    """
+    dilated = profile.copy()
+    for shift in range(1, radius + 1):
+        dilated |= np.roll(profile, shift) | np.roll(profile, -shift)
+    return dilated
+
+@njit(cache=True)
+def _border_cells_nb(territory, land_mask):
+    """
+    Liste les cellules terrestres hors territoire adjacentes au territoire (Numba).
+
+    Args:
+        territory: Masque booléen du territoire.
+        land_mask: Masque booléen des terres émergées.
+
+    Returns:
+        Indices à plat (y * grid_size + x) des cellules frontalières.
+    """
+    grid_size = territory.shape[0]
+    border = np.zeros((grid_size, grid_size), dtype=np.bool_)
+    count = 0
+
+    for y in range(grid_size):
+        for x in range(grid_size):
+            if not territory[y, x]:
+                continue
+
+            for dy in range(-1, 2):
+                for dx in range(-1, 2):
+                    ny = (y + dy) % grid_size
+                    nx = (x + dx) % grid_size
+
+                    if not territory[ny, nx] and not border[ny, nx] and land_mask[ny, nx]:
+                        border[ny, nx] = True
+                        count += 1
+
+    cells = np.empty(count, dtype=np.int64)
+    i = 0
+    for y in range(grid_size):
+        for x in range(grid_size):
+            if border[y, x]:
+                cells[i] = y * grid_size + x
+                i += 1
+
+    return cells
+
+@njit(cache=True)
+def _territories_close_nb(territory_a, territory_b, radius):
+    """
+    Vérifie si deux territoires sont à moins de radius cellules l'un de l'autre (Numba).
+
+    Args:
+        territory_a: Masque booléen du premier territoire.
+        territory_b: Masque booléen du second territoire.
+        radius: Rayon de proximité (distance de Tchebychev).
+
+    Returns:
+        True dès qu'une cellule de territory_b est dans le voisinage de territory_a.
+    """
+    grid_size = territory_a.shape[0]
+
+    for y in range(grid_size):
+        for x in range(grid_size):
+            if not territory_a[y, x]:
+                continue
+
+            for dy in range(-radius, radius + 1):
+                ny = (y + dy) % grid_size
+                for dx in range(-radius, radius + 1):
+                    if territory_b[ny, (x + dx) % grid_size]:
+                        return True
+
+    return False
+
+@njit(cache=True)
+def _contested_cells_nb(territory, other_cells):
+    """
+    Filtre les cellules adverses adjacentes à un territoire (Numba).
+
+    Args:
+        territory: Masque booléen du territoire conquérant.
+        other_cells: Indices à plat des cellules du territoire convoité.
+
+    Returns:
+        Indices à plat (y * grid_size + x) des cellules frontalières.
+    """
+    grid_size = territory.shape[0]
+    cells = np.empty(other_cells.size, dtype=np.int64)
+    count = 0
+
+    for i in range(other_cells.size):
+        cell = other_cells[i]
+        y = cell // grid_size
+        x = cell - y * grid_size
+
+        # Voisins sur la grille torique
+        north = y - 1 if y > 0 else grid_size - 1
+        south = y + 1 if y < grid_size - 1 else 0
+        west = x - 1 if x > 0 else grid_size - 1
+        east = x + 1 if x < grid_size - 1 else 0
+
+        if (territory[north, west] or territory[north, x] or territory[north, east]
+                or territory[y, west] or territory[y, east]
+                or territory[south, west] or territory[south, x] or territory[south, east]):
+            cells[count] = cell
+            count += 1
+
+    return cells[:count]
+
 class Civilization:
     """Classe représentant une civilisation issue d'une espèce intelligente."""
     
@@ -74,7 +358,7 @@ class Civilization:
         # Culture
         self.language = self._generate_language()
         self.religion = self._generate_religion() if random.random() < 0.8 else None
-        self.art_focus = random.choice(["visuel", "auditif", "conceptuel", "performatif"])
+        self.art_focus = random.choice(_ART_FOCUSES)
         
         # Économie
         self.economy_type = "subsistance"  # subsistance, troc, monétaire, etc.
@@ -83,17 +367,21 @@ class Civilization:
         # Territoire
         self.territory = np.zeros((manager.world.geography.grid_size, 
                                   manager.world.geography.grid_size), dtype=bool)
+        self._proximity_zone = None  # Territoire dilaté (cache, voir _territory_changed)
+        self._extent = None  # Lignes et colonnes occupées (cache, voir _get_extent)
+        self._territory_size = 0  # Nombre de cellules du territoire
+        self._capacity_cache = None  # (niveau, taille, capacité) de la dernière évaluation
         self._initialize_territory()
         
         # Relations avec d'autres civilisations
         self.relations = {}  # {civ_id: relation_value}
         
         # Historique
-        self.history = []
+        self.history = deque(maxlen=_HISTORY_LENGTH)  # Événements récents (HistoryEvent)
         self.add_history_event("Fondation", f"Émergence de la civilisation {self.name}")
         
-        # Technologies découvertes
-        self.technologies = set()
+        # Technologies découvertes (masque de bits, voir _TECH_BIT)
+        self.technologies = 0
         
         # État
         self.is_extinct = False
@@ -101,23 +389,16 @@ class Civilization:
     
     def _generate_name(self):
         """Génère un nom pour la civilisation."""
-        prefixes = ["Ar", "Bel", "Civ", "Dor", "El", "Fal", "Gal", "Hy", "Il", "Jor", 
-                   "Kal", "Lum", "Mer", "Neb", "Orb", "Prim", "Qua", "Rim", "Sol", "Ter"]
-        suffixes = ["ia", "or", "an", "ium", "aria", "alis", "oria", "ium", "aris", "on"]
-        
-        return f"{random.choice(prefixes)}{random.choice(suffixes)}"
+        return f"{random.choice(_NAME_PREFIXES)}{random.choice(_NAME_SUFFIXES)}"
     
     def _generate_language(self):
         """Génère une langue pour la civilisation."""
-        vowels = "aeiouy"
-        consonants = "bcdfghjklmnpqrstvwxz"
-        
         # Caractéristiques de la langue
         language = {
             "name": f"{self.name}an",
-            "vowels": ''.join(random.sample(vowels, k=random.randint(3, 6))),
-            "consonants": ''.join(random.sample(consonants, k=random.randint(10, 15))),
-            "syllable_structure": random.choice(["CV", "CVC", "VC", "CVVC"]),
+            "vowels": ''.join(random.sample(_VOWELS, k=random.randint(3, 6))),
+            "consonants": ''.join(random.sample(_CONSONANTS, k=random.randint(10, 15))),
+            "syllable_structure": random.choice(_SYLLABLE_STRUCTURES),
             "tone": random.random() < 0.3,  # 30% de chance d'être tonale
             "writing": None  # Pas d'écriture au début
         }
@@ -126,34 +407,27 @@ class Civilization:
     
     def _generate_religion(self):
         """Génère une religion pour la civilisation."""
-        types = ["animisme", "polythéisme", "monothéisme", "dualisme", "philosophie naturelle"]
-        focuses = ["nature", "ancêtres", "astres", "éléments", "cycle de vie", "ordre cosmique"]
-        
         religion = {
-            "type": random.choice(types),
-            "focus": random.choice(focuses),
+            "type": random.choice(_RELIGION_TYPES),
+            "focus": random.choice(_RELIGION_FOCUSES),
             "name": f"Culte de {self._generate_deity_name()}",
             "practices": []
         }
         
         # Pratiques religieuses
-        possible_practices = ["prière", "méditation", "sacrifice", "rituel", "pèlerinage", "jeûne"]
         num_practices = random.randint(1, 3)
-        religion["practices"] = random.sample(possible_practices, k=num_practices)
+        religion["practices"] = random.sample(_RELIGION_PRACTICES, k=num_practices)
         
         return religion
     
     def _generate_deity_name(self):
         """Génère un nom de divinité."""
-        prefixes = ["Anu", "Bel", "Cro", "Dra", "Eos", "Fyr", "Gai", "Hel", "Ish", "Jor"]
-        suffixes = ["os", "us", "a", "is", "ar", "on", "oth", "um", "ax", "ir"]
-        
-        return f"{random.choice(prefixes)}{random.choice(suffixes)}"
+        return f"{random.choice(_DEITY_PREFIXES)}{random.choice(_DEITY_SUFFIXES)}"
     
     def _initialize_territory(self):
         """Initialise le territoire de la civilisation."""
         grid_size = self.manager.world.geography.grid_size
-        biomes = self.manager.world.geography.biomes
+        land_mask = self.manager.world.geography.land_mask
         
         # Recherche des zones les plus peuplées par l'espèce fondatrice
         species_pop = self.founding_species.population_map
@@ -163,17 +437,18 @@ class Civilization:
         
         # Expansion initiale autour du point de départ
         radius = 3  # Rayon initial
-        
-        for y in range(grid_size):
-            for x in range(grid_size):
-                # Distance au centre
-                dx = min(abs(x - start_x), grid_size - abs(x - start_x))
-                dy = min(abs(y - start_y), grid_size - abs(y - start_y))
-                distance = np.sqrt(dx**2 + dy**2)
-                
-                # Territoire initial
-                if distance <= radius and biomes[y, x] > 1:  # Pas dans l'océan
-                    self.territory[y, x] = True
+
+        # Distances toroïdales au centre, par ligne et par colonne
+        coords = np.arange(grid_size)
+        dy = np.abs(coords - start_y)
+        dy = np.minimum(dy, grid_size - dy)
+        dx = np.abs(coords - start_x)
+        dx = np.minimum(dx, grid_size - dx)
+
+        # Territoire initial (distance au carré pour éviter la racine)
+        dist2 = dy[:, None] ** 2 + dx[None, :] ** 2
+        self.territory = (dist2 <= radius * radius) & land_mask  # Pas dans l'océan
+        self._territory_changed()
     
     def add_history_event(self, event_type, description):
         """
@@ -183,129 +458,78 @@ class Civilization:
             event_type: Type d'événement.
             description: Description de l'événement.
         """
-        event = {
-            "year": self.manager.world.age,
-            "type": event_type,
-            "description": description
-        }
+        event = HistoryEvent(self.manager.world.age, event_type, description)
         
         self.history.append(event)
-        self.logger.info(f"[{self.name}] Année {self.manager.world.age}: {event_type} - {description}")
+        
+        # Formatage du message uniquement si le niveau INFO est actif
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("[%s] Année %d: %s - %s", self.name, event.year, event_type, description)
     
     def update(self):
-        """Met à jour la civilisation pour une année de simulation."""
+        """
+        Met à jour la civilisation pour une année de simulation.
+        
+        La croissance de la population et le progrès technologique sont calculés
+        au préalable pour toutes les civilisations par CivilizationManager._update_growth,
+        à partir de leur état en début d'année: ils ne tiennent pas compte des guerres,
+        conquêtes et événements des civilisations mises à jour avant celle-ci la même année.
+        """
         if self.is_extinct:
             return
         
         self.age += 1
         
-        # Mise à jour de la population
-        self._update_population()
-        
         # Vérification de l'extinction
         if self.population <= 100:
             self._go_extinct("Population trop faible")
             return
         
-        # Développement technologique
-        self._advance_technology()
-        
         # Évolution sociale et culturelle
         self._evolve_society()
         
-        # Expansion territoriale
-        self._expand_territory()
-        
-        # Relations avec d'autres civilisations
-        self._manage_relations()
+        # Expansion territoriale et relations, à cadence réduite pour les
+        # civilisations isolées et peu actives
+        interval = self._update_interval()
+        if self.age % interval == 0:
+            self._expand_territory(interval)
+            self._manage_relations()
         
         # Événements aléatoires
         self._random_events()
     
-    def _update_population(self):
-        """Met à jour la population de la civilisation."""
-        # Facteurs de croissance
-        base_growth = 0.01  # 1% de croissance annuelle de base
-        
-        # Modificateurs selon le niveau technologique
-        tech_modifiers = {
-            TechLevel.PRIMITIVE: 0.005,
-            TechLevel.AGRICULTURAL: 0.015,
-            TechLevel.MEDIEVAL: 0.01,
-            TechLevel.INDUSTRIAL: 0.02,
-            TechLevel.INFORMATION: 0.015,
-            TechLevel.SPACE: 0.01,
-            TechLevel.ADVANCED: 0.005,
-            TechLevel.STELLAR: 0.003
-        }
-        
-        tech_modifier = tech_modifiers.get(self.tech_level, 0.01)
-        
-        # Modificateur de stabilité
-        stability_modifier = self.stability * 0.01
-        
-        # Calcul de la croissance
-        growth_rate = base_growth + tech_modifier + stability_modifier
-        
-        # Facteurs limitants
-        carrying_capacity = self._calculate_carrying_capacity()
+    def _update_interval(self):
+        """
+        Détermine la cadence des mises à jour territoriales et diplomatiques.
         
-        if self.population > carrying_capacity:
-            # Croissance négative si au-dessus de la capacité de charge
-            growth_rate = -0.01
-        elif self.population > carrying_capacity * 0.8:
-            # Ralentissement de la croissance près de la capacité
-            growth_rate *= (1 - (self.population / carrying_capacity))
+        Returns:
+            Nombre d'années entre deux mises à jour
+        """
+        # Une petite civilisation primitive sans voisins connus évolue lentement
+        if self.population <= 100000 and not self.relations and self.tech_level.value < 2:
+            return _QUIET_UPDATE_INTERVAL
         
-        # Application de la croissance
-        self.population = int(self.population * (1 + growth_rate))
+        return 1
     
     def _calculate_carrying_capacity(self):
         """Calcule la capacité de charge du territoire."""
-        # Capacité de base selon le niveau technologique
-        base_capacities = {
-            TechLevel.PRIMITIVE: 10000,
-            TechLevel.AGRICULTURAL: 100000,
-            TechLevel.MEDIEVAL: 1000000,
-            TechLevel.INDUSTRIAL: 10000000,
-            TechLevel.INFORMATION: 100000000,
-            TechLevel.SPACE: 1000000000,
-            TechLevel.ADVANCED: 10000000000,
-            TechLevel.STELLAR: 100000000000
-        }
+        # Réutilisation du dernier calcul si le niveau et la taille n'ont pas changé
+        tech_index = self.tech_level.value
+        territory_size = self._territory_size
+        cache = self._capacity_cache
+        if cache is not None and cache[0] == tech_index and cache[1] == territory_size:
+            return cache[2]
         
-        base_capacity = base_capacities.get(self.tech_level, 10000)
+        # Capacité de base selon le niveau technologique
+        base_capacity = _TECH_CAP[tech_index]
         
         # Ajustement selon la taille du territoire
-        territory_size = np.sum(self.territory)
         territory_factor = territory_size / 100  # Facteur d'échelle
         
-        return base_capacity * territory_factor
-    
-    def _advance_technology(self):
-        """Fait progresser le développement technologique."""
-        # Facteurs influençant le progrès technologique
-        base_progress = 0.001  # Progrès de base par an
-        
-        # Modificateurs
-        intelligence_modifier = self.founding_species.intelligence * 0.01
-        creativity_modifier = self.creativity * 0.005
-        population_modifier = min(0.01, self.population / 1000000 * 0.005)
-        stability_modifier = self.stability * 0.002
-        
-        # Calcul du progrès
-        progress = base_progress + intelligence_modifier + creativity_modifier + population_modifier + stability_modifier
-        
-        # Ralentissement aux niveaux supérieurs
-        if self.tech_level.value >= 4:  # À partir du niveau Information
-            progress *= 0.5
-        
-        # Mise à jour du progrès
-        self.tech_progress += progress
+        capacity = base_capacity * territory_factor
+        self._capacity_cache = (tech_index, territory_size, capacity)
         
-        # Passage au niveau suivant si le seuil est atteint
-        if self.tech_progress >= 1.0:
-            self._advance_tech_level()
+        return capacity
     
     def _advance_tech_level(self):
         """Fait passer la civilisation au niveau technologique suivant."""
@@ -314,7 +538,7 @@ class Civilization:
         # Vérification que ce n'est pas déjà le niveau maximum
         if self.tech_level.value < len(TechLevel) - 1:
             # Passage au niveau suivant
-            self.tech_level = TechLevel(self.tech_level.value + 1)
+            self.tech_level = _TECH_BY_INDEX[self.tech_level.value + 1]
             self.tech_progress = 0.0
             
             # Enregistrement de l'événement
@@ -329,26 +553,23 @@ class Civilization:
     
     def _discover_technologies(self):
         """Découvre des technologies spécifiques au niveau technologique actuel."""
-        # Technologies par niveau
-        tech_discoveries = {
-            TechLevel.PRIMITIVE: ["Feu", "Outils en pierre", "Langage écrit"],
-            TechLevel.AGRICULTURAL: ["Agriculture", "Poterie", "Domestication", "Métallurgie de base"],
-            TechLevel.MEDIEVAL: ["Architecture", "Mathématiques", "Astronomie", "Navigation"],
-            TechLevel.INDUSTRIAL: ["Machine à vapeur", "Électricité", "Chimie", "Transport mécanisé"],
-            TechLevel.INFORMATION: ["Informatique", "Télécommunications", "Médecine avancée", "Énergie nucléaire"],
-            TechLevel.SPACE: ["Voyage spatial", "Robotique", "Intelligence artificielle", "Biotechnologie"],
-            TechLevel.ADVANCED: ["Manipulation génétique", "Nanotechnologie", "Fusion nucléaire", "Réalité virtuelle"],
-            TechLevel.STELLAR: ["Propulsion FTL", "Terraformation", "Conscience numérique", "Manipulation quantique"]
-        }
-        
         # Découverte des technologies du niveau actuel
-        techs = tech_discoveries.get(self.tech_level, [])
+        techs = _TECH_DISCOVERIES.get(self.tech_level, ())
         
         for tech in techs:
-            if tech not in self.technologies:
-                self.technologies.add(tech)
+            bit = _TECH_BIT[tech]
+            if not self.technologies & bit:
+                self.technologies |= bit
                 self.add_history_event("Découverte technologique", f"Découverte de: {tech}")
     
+    def get_technologies(self):
+        """Retourne la liste des technologies découvertes, dans l'ordre de l'arbre."""
+        return [tech for tech in _TECH_NAMES if self.technologies & _TECH_BIT[tech]]
+    
+    def get_territory_size(self):
+        """Retourne le nombre de cellules du territoire, tenu à jour à chaque modification."""
+        return self._territory_size
+    
     def _tech_advancement_effects(self):
         """Applique les effets d'une avancée technologique sur la société."""
         # Changements sociaux selon le niveau technologique
@@ -372,14 +593,14 @@ class Civilization:
             
             # Développement de l'écriture si pas encore présent
             if not self.language.get("writing"):
-                self.language["writing"] = random.choice(["pictographique", "idéographique", "alphabétique"])
+                self.language["writing"] = random.choice(_WRITING_SYSTEMS)
                 self.add_history_event("Développement culturel", 
                                      f"Création d'un système d'écriture {self.language['writing']}")
             
         elif self.tech_level == TechLevel.INDUSTRIAL:
             # Révolution industrielle
             if random.random() < 0.7:
-                self.government = random.choice([GovernmentType.REPUBLIC, GovernmentType.OLIGARCHY])
+                self.government = random.choice(_INDUSTRIAL_GOVERNMENTS)
                 self.add_history_event("Évolution politique", 
                                      f"Transition vers une {self.government.name}")
             
@@ -388,7 +609,7 @@ class Civilization:
         elif self.tech_level == TechLevel.INFORMATION:
             # Ère de l'information
             if random.random() < 0.6:
-                self.government = random.choice([GovernmentType.DEMOCRACY, GovernmentType.TECHNOCRACY])
+                self.government = random.choice(_INFORMATION_GOVERNMENTS)
                 self.add_history_event("Évolution politique", 
                                      f"Transition vers une {self.government.name}")
             
@@ -397,7 +618,7 @@ class Civilization:
         elif self.tech_level == TechLevel.ADVANCED:
             # Technologies avancées
             if random.random() < 0.5:
-                self.government = random.choice([GovernmentType.TECHNOCRACY, GovernmentType.AI_GOVERNANCE])
+                self.government = random.choice(_ADVANCED_GOVERNMENTS)
                 self.add_history_event("Évolution politique", 
                                      f"Transition vers une {self.government.name}")
             
@@ -408,7 +629,7 @@ class Civilization:
         # Évolution lente des attributs sociaux
         if random.random() < 0.05:  # 5% de chance par an
             # Sélection d'un attribut à faire évoluer
-            attribute = random.choice(["stability", "aggression", "cooperation", "creativity"])
+            attribute = random.choice(_SOCIAL_ATTRIBUTES)
             old_value = getattr(self, attribute)
             
             # Amplitude du changement
@@ -426,7 +647,7 @@ class Civilization:
         
         # Évolution religieuse
         if self.religion and random.random() < 0.02:  # 2% de chance par an
-            change_type = random.choice(["réforme", "schisme", "syncrétisme"])
+            change_type = random.choice(_RELIGIOUS_CHANGES)
             
             if change_type == "réforme":
                 self.religion["name"] = f"Réforme de {self.religion['name']}"
@@ -441,42 +662,37 @@ class Civilization:
                 self.religion["name"] = f"{self.religion['name']} Universel"
                 self.add_history_event("Évolution religieuse", f"Syncrétisme religieux: {self.religion['name']}")
     
-    def _expand_territory(self):
-        """Gère l'expansion territoriale de la civilisation."""
+    def _expand_territory(self, years=1):
+        """
+        Gère l'expansion territoriale de la civilisation.
+        
+        Args:
+            years: Nombre d'années couvertes par cette mise à jour
+        """
         # Probabilité d'expansion basée sur la population et le niveau technologique
         expansion_probability = 0.1 * (self.tech_level.value + 1) * min(1.0, self.population / 10000)
+        if years > 1:
+            expansion_probability = 1 - (1 - min(1.0, expansion_probability)) ** years
         
         if random.random() < expansion_probability:
-            grid_size = self.manager.world.geography.grid_size
-            biomes = self.manager.world.geography.biomes
-            
-            # Recherche des frontières actuelles
-            border_cells = []
-            
-            for y in range(grid_size):
-                for x in range(grid_size):
-                    if not self.territory[y, x]:
-                        continue
-                    
-                    # Vérification des cellules adjacentes
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dx == 0 and dy == 0:
-                                continue
-                            
-                            nx, ny = (x + dx) % grid_size, (y + dy) % grid_size
-                            
-                            # Si c'est une cellule non-territoire adjacente à notre territoire
-                            if not self.territory[ny, nx] and biomes[ny, nx] > 1:  # Pas dans l'océan
-                                border_cells.append((nx, ny))
-            
+            land_mask = self.manager.world.geography.land_mask
+
+            # Recherche des frontières actuelles: cellules hors territoire
+            # adjacentes à notre territoire, hors océan
+            if HAS_NUMBA:
+                border_cells = _border_cells_nb(self.territory, land_mask)
+            else:
+                border = _dilate(self.territory) & ~self.territory & land_mask
+                border_cells = np.flatnonzero(border)
+
             # Expansion vers une cellule frontalière aléatoire
-            if border_cells:
-                num_expansions = min(len(border_cells), random.randint(1, 3))
-                expansion_cells = random.sample(border_cells, num_expansions)
-                
-                for x, y in expansion_cells:
-                    self.territory[y, x] = True
+            if len(border_cells):
+                num_expansions = min(len(border_cells), random.randint(years, 3 * years))
+                chosen = self.manager.world.rng.choice(len(border_cells), num_expansions, replace=False)
+
+                # ravel() renvoie une vue de la grille contiguë: écriture en une passe
+                self.territory.ravel()[border_cells[chosen]] = True
+                self._territory_changed(num_expansions)
                 
                 # Enregistrement de l'expansion
                 if num_expansions > 0:
@@ -485,37 +701,38 @@ class Civilization:
     
     def _manage_relations(self):
         """Gère les relations avec d'autres civilisations."""
-        # Mise à jour des relations existantes
-        for civ_id, relation in list(self.relations.items()):
-            # Vérification que la civilisation existe toujours
-            other_civ = None
-            for civ in self.manager.civilizations:
-                if id(civ) == civ_id:
-                    other_civ = civ
-                    break
+        # Vérification que les partenaires existent toujours
+        partners = []
+        for civ_id in list(self.relations):
+            other_civ = self.manager.civilizations_by_id.get(civ_id)
             
             if not other_civ or other_civ.is_extinct:
                 del self.relations[civ_id]
                 continue
             
-            # Évolution naturelle des relations
-            drift = random.uniform(-0.05, 0.05)
+            partners.append(other_civ)
+        
+        if partners:
+            # Évolution naturelle des relations, calculée pour tous les partenaires à la fois
+            ids = [id(other_civ) for other_civ in partners]
+            relations = np.array([self.relations[civ_id] for civ_id in ids])
+            drift = self.manager.world.rng.uniform(-0.05, 0.05, len(partners))
             
             # Facteurs d'influence
-            if self.government == other_civ.government:
-                drift += 0.01  # Gouvernements similaires
-            
-            if abs(self.tech_level.value - other_civ.tech_level.value) > 2:
-                drift -= 0.01  # Grand écart technologique
+            same_government = np.array([self.government == other_civ.government for other_civ in partners])
+            other_tech = np.array([other_civ.tech_level.value for other_civ in partners])
+            drift += np.where(same_government, 0.01, 0.0)  # Gouvernements similaires
+            drift -= np.where(np.abs(self.tech_level.value - other_tech) > 2, 0.01, 0.0)  # Grand écart technologique
             
             # Influence de l'agressivité
             drift -= (self.aggression - 0.5) * 0.02
             
-            # Mise à jour de la relation
-            self.relations[civ_id] = max(-1.0, min(1.0, relation + drift))
+            # Mise à jour des relations, bornées à [-1, 1]
+            self.relations.update(zip(ids, np.clip(relations + drift, -1.0, 1.0).tolist()))
             
             # Événements basés sur les relations
-            self._check_relation_events(other_civ)
+            for other_civ in partners:
+                self._check_relation_events(other_civ)
         
         # Établissement de relations avec de nouvelles civilisations
         for other_civ in self.manager.civilizations:
@@ -550,23 +767,57 @@ class Civilization:
     
     def _are_civilizations_close(self, other_civ):
         """Vérifie si deux civilisations sont géographiquement proches."""
-        # Vérification de la proximité des territoires
-        grid_size = self.manager.world.geography.grid_size
+        # Rejet rapide: les lignes et les colonnes occupées doivent être proches
+        _, _, near_rows, near_cols = self._get_extent()
+        other_rows, other_cols, _, _ = other_civ._get_extent()
+        if not (np.any(near_rows & other_rows) and np.any(near_cols & other_cols)):
+            return False
         
-        for y in range(grid_size):
-            for x in range(grid_size):
-                if not self.territory[y, x]:
-                    continue
-                
-                # Vérification des cellules dans un rayon
-                for dy in range(-5, 6):
-                    for dx in range(-5, 6):
-                        nx, ny = (x + dx) % grid_size, (y + dy) % grid_size
-                        
-                        if other_civ.territory[ny, nx]:
-                            return True
-        
-        return False
+        # Vérification de la proximité des territoires (rayon de 5 cellules)
+        if HAS_NUMBA:
+            return _territories_close_nb(self.territory, other_civ.territory, 5)
+        
+        return bool(np.any(self._get_proximity_zone() & other_civ.territory))
+    
+    def _get_proximity_zone(self):
+        """Retourne le territoire dilaté de 5 cellules, recalculé si nécessaire."""
+        if self._proximity_zone is None:
+            zone = self.territory
+            for _ in range(5):
+                zone = _dilate(zone)
+            self._proximity_zone = zone
+        
+        return self._proximity_zone
+    
+    def _get_extent(self):
+        """
+        Retourne l'emprise du territoire, recalculée si nécessaire.
+        
+        Returns:
+            Tuple (lignes, colonnes, lignes à 5 cellules près, colonnes à 5 cellules près)
+            de masques booléens 1D.
+        """
+        if self._extent is None:
+            rows = self.territory.any(axis=1)
+            cols = self.territory.any(axis=0)
+            self._extent = (rows, cols, _dilate_profile(rows, 5), _dilate_profile(cols, 5))
+        
+        return self._extent
+    
+    def _territory_changed(self, delta=None):
+        """
+        Met à jour les données dérivées du territoire après une modification.
+        
+        Args:
+            delta: Variation connue du nombre de cellules (recompté si None).
+        """
+        self._proximity_zone = None
+        self._extent = None
+        
+        if delta is None:
+            self._territory_size = int(np.count_nonzero(self.territory))
+        else:
+            self._territory_size += delta
     
     def _check_relation_events(self, other_civ):
         """Vérifie si des événements se produisent basés sur les relations."""
@@ -574,7 +825,7 @@ class Civilization:
         
         # Événements positifs
         if relation > 0.7 and random.random() < 0.1:
-            event_type = random.choice(["alliance", "traité commercial", "échange culturel"])
+            event_type = random.choice(_FRIENDLY_RELATION_EVENTS)
             
             self.add_history_event("Diplomatie positive", 
                                  f"{event_type.capitalize()} avec {other_civ.name}")
@@ -592,7 +843,7 @@ class Civilization:
         
         # Événements négatifs
         elif relation < -0.7 and random.random() < 0.1:
-            event_type = random.choice(["conflit", "guerre", "embargo"])
+            event_type = random.choice(_HOSTILE_RELATION_EVENTS)
             
             self.add_history_event("Diplomatie négative", 
                                  f"{event_type.capitalize()} avec {other_civ.name}")
@@ -690,112 +941,62 @@ class Civilization:
             other_civ: La civilisation perdant du territoire.
             percentage: Le pourcentage de territoire à prendre (0-1).
         """
-        grid_size = self.manager.world.geography.grid_size
-        
-        # Identification des cellules frontalières
-        border_cells = []
-        
-        for y in range(grid_size):
-            for x in range(grid_size):
-                if not other_civ.territory[y, x]:
-                    continue
-                
-                # Vérification des cellules adjacentes
-                for dy in [-1, 0, 1]:
-                    for dx in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        
-                        nx, ny = (x + dx) % grid_size, (y + dy) % grid_size
-                        
-                        # Si c'est une cellule de notre territoire adjacente à leur territoire
-                        if self.territory[ny, nx]:
-                            border_cells.append((x, y))
-                            break
-                    else:
-                        continue
-                    break
+        # Identification des cellules frontalières: cellules de leur territoire dont une
+        # des 8 voisines appartient à notre territoire (indices à plat)
+        if HAS_NUMBA and other_civ._territory_size * 8 < other_civ.territory.size:
+            # Territoire peu étendu: on ne visite que ses cellules
+            border_cells = _contested_cells_nb(self.territory, np.flatnonzero(other_civ.territory))
+        else:
+            border_cells = np.flatnonzero(other_civ.territory & _adjacent(self.territory))
         
         # Calcul du nombre de cellules à prendre
-        num_cells = int(len(border_cells) * percentage)
+        num_cells = min(int(len(border_cells) * percentage), len(border_cells))
         
-        if num_cells > 0 and border_cells:
+        if num_cells > 0:
             # Sélection aléatoire des cellules à prendre
-            cells_to_take = random.sample(border_cells, min(num_cells, len(border_cells)))
+            cells_to_take = self.manager.world.rng.choice(border_cells, num_cells, replace=False)
+            
+            # Cellules déjà partagées avec notre territoire (pas de gain pour nous)
+            own_cells = self.territory.ravel()
+            gained = num_cells - int(np.count_nonzero(own_cells[cells_to_take]))
             
             # Transfert du territoire
-            for x, y in cells_to_take:
-                self.territory[y, x] = True
-                other_civ.territory[y, x] = False
+            own_cells[cells_to_take] = True
+            other_civ.territory.ravel()[cells_to_take] = False
+            
+            self._territory_changed(gained)
+            other_civ._territory_changed(-num_cells)
     
     def _random_events(self):
         """Génère des événements aléatoires pour la civilisation."""
-        # Probabilité de base pour un événement
-        event_probability = 0.05  # 5% par an
-        
-        if random.random() < event_probability:
-            # Sélection d'un type d'événement
-            event_types = ["culturel", "politique", "économique", "catastrophe", "découverte"]
-            weights = [1, 1, 1, 0.5, 0.8]  # Les catastrophes sont moins fréquentes
-            
-            event_type = random.choices(event_types, weights=weights)[0]
-            
-            # Génération de l'événement
-            if event_type == "culturel":
-                self._generate_cultural_event()
-            elif event_type == "politique":
-                self._generate_political_event()
-            elif event_type == "économique":
-                self._generate_economic_event()
-            elif event_type == "catastrophe":
-                self._generate_disaster_event()
-            elif event_type == "découverte":
-                self._generate_discovery_event()
+        # Pas d'événement la plupart des années
+        if random.random() >= _EVENT_PROBABILITY:
+            return
+        
+        # Sélection d'un type d'événement selon la distribution cumulée
+        event_index = bisect.bisect(_EVENT_CDF, random.random() * _EVENT_TOTAL)
+        
+        # Génération de l'événement
+        getattr(self, _EVENT_HANDLERS[event_index])()
     
     def _generate_cultural_event(self):
         """Génère un événement culturel."""
-        events = [
-            "Âge d'or artistique",
-            "Révolution culturelle",
-            "Mouvement philosophique majeur",
-            "Réforme linguistique",
-            "Festival traditionnel institutionnalisé"
-        ]
-        
-        event = random.choice(events)
+        event = random.choice(_CULTURAL_EVENT_NAMES)
         self.add_history_event("Culture", event)
         
         # Effets de l'événement
-        if event == "Âge d'or artistique":
-            self.creativity += 0.1
-        elif event == "Révolution culturelle":
-            self.stability -= 0.1
-            self.creativity += 0.15
-        elif event == "Mouvement philosophique majeur":
-            self.tech_progress += 0.05
-        elif event == "Réforme linguistique":
-            pass  # Effet symbolique
-        elif event == "Festival traditionnel institutionnalisé":
-            self.stability += 0.05
+        for attribute, delta in _CULTURAL_EVENTS[event]:
+            setattr(self, attribute, getattr(self, attribute) + delta)
     
     def _generate_political_event(self):
         """Génère un événement politique."""
-        events = [
-            "Révolution",
-            "Réforme gouvernementale",
-            "Guerre civile",
-            "Unification",
-            "Sécession"
-        ]
-        
-        event = random.choice(events)
+        event = random.choice(_POLITICAL_EVENTS)
         self.add_history_event("Politique", event)
         
         # Effets de l'événement
         if event == "Révolution":
             old_gov = self.government
-            possible_govs = list(GovernmentType)
-            self.government = random.choice(possible_govs)
+            self.government = random.choice(_ALL_GOVERNMENTS)
             self.stability -= 0.2
             self.add_history_event("Changement de régime", 
                                  f"{old_gov.name} → {self.government.name}")
@@ -812,32 +1013,23 @@ class Civilization:
             
         elif event == "Sécession":
             # Perte de territoire
-            territory_count = np.sum(self.territory)
+            territory_count = self._territory_size
             lost_percentage = random.uniform(0.1, 0.3)
             
             # Sélection aléatoire de cellules à perdre
-            territory_indices = np.where(self.territory)
-            indices_to_lose = random.sample(range(len(territory_indices[0])), 
-                                          int(territory_count * lost_percentage))
+            territory_cells = np.flatnonzero(self.territory)
+            num_lost = int(territory_count * lost_percentage)
+            lost = self.manager.world.rng.choice(territory_cells, num_lost, replace=False)
             
-            for idx in indices_to_lose:
-                y, x = territory_indices[0][idx], territory_indices[1][idx]
-                self.territory[y, x] = False
+            self.territory.ravel()[lost] = False
+            self._territory_changed(-num_lost)
             
             self.population = int(self.population * (1 - lost_percentage))
             self.stability -= 0.1
     
     def _generate_economic_event(self):
         """Génère un événement économique."""
-        events = [
-            "Boom économique",
-            "Récession",
-            "Découverte de ressources",
-            "Innovation commerciale",
-            "Famine"
-        ]
-        
-        event = random.choice(events)
+        event = random.choice(_ECONOMIC_EVENTS)
         self.add_history_event("Économie", event)
         
         # Effets de l'événement
@@ -850,7 +1042,7 @@ class Civilization:
             self.stability -= 0.1
             
         elif event == "Découverte de ressources":
-            resource = random.choice(["minéraux", "énergie", "nourriture", "matériaux rares"])
+            resource = random.choice(_RESOURCES)
             self.add_history_event("Ressources", f"Découverte de {resource}")
             self.tech_progress += 0.02
             
@@ -863,15 +1055,7 @@ class Civilization:
     
     def _generate_disaster_event(self):
         """Génère un événement catastrophique."""
-        events = [
-            "Épidémie",
-            "Catastrophe naturelle",
-            "Accident technologique",
-            "Conflit interne",
-            "Crise environnementale"
-        ]
-        
-        event = random.choice(events)
+        event = random.choice(_DISASTER_EVENTS)
         severity = random.uniform(0.1, 0.5)  # Sévérité de la catastrophe
         
         self.add_history_event("Catastrophe", f"{event} (Sévérité: {severity:.2f})")
@@ -885,13 +1069,12 @@ class Civilization:
             self.population = int(self.population * (1 - severity * 0.2))
             
             # Perte de territoire
-            territory_indices = np.where(self.territory)
-            indices_to_lose = random.sample(range(len(territory_indices[0])), 
-                                          int(np.sum(self.territory) * severity * 0.1))
+            territory_cells = np.flatnonzero(self.territory)
+            num_lost = int(self._territory_size * severity * 0.1)
+            lost = self.manager.world.rng.choice(territory_cells, num_lost, replace=False)
             
-            for idx in indices_to_lose:
-                y, x = territory_indices[0][idx], territory_indices[1][idx]
-                self.territory[y, x] = False
+            self.territory.ravel()[lost] = False
+            self._territory_changed(-num_lost)
             
         elif event == "Accident technologique":
             if self.tech_level.value >= 3:  # À partir du niveau industriel
@@ -916,23 +1099,13 @@ class Civilization:
                                  f"Avancée scientifique majeure (+{tech_boost:.2f} progrès tech)")
             
             # Possibilité de découvrir une technologie spécifique
-            next_level = TechLevel(min(7, self.tech_level.value + 1))
-            tech_discoveries = {
-                TechLevel.PRIMITIVE: ["Feu", "Outils en pierre", "Langage écrit"],
-                TechLevel.AGRICULTURAL: ["Agriculture", "Poterie", "Domestication", "Métallurgie de base"],
-                TechLevel.MEDIEVAL: ["Architecture", "Mathématiques", "Astronomie", "Navigation"],
-                TechLevel.INDUSTRIAL: ["Machine à vapeur", "Électricité", "Chimie", "Transport mécanisé"],
-                TechLevel.INFORMATION: ["Informatique", "Télécommunications", "Médecine avancée", "Énergie nucléaire"],
-                TechLevel.SPACE: ["Voyage spatial", "Robotique", "Intelligence artificielle", "Biotechnologie"],
-                TechLevel.ADVANCED: ["Manipulation génétique", "Nanotechnologie", "Fusion nucléaire", "Réalité virtuelle"],
-                TechLevel.STELLAR: ["Propulsion FTL", "Terraformation", "Conscience numérique", "Manipulation quantique"]
-            }
-            
-            possible_techs = tech_discoveries.get(next_level, [])
+            next_level = _TECH_BY_INDEX[min(7, self.tech_level.value + 1)]
+            possible_techs = _TECH_DISCOVERIES.get(next_level, ())
             if possible_techs and random.random() < 0.3:
                 tech = random.choice(possible_techs)
-                if tech not in self.technologies:
-                    self.technologies.add(tech)
+                bit = _TECH_BIT[tech]
+                if not self.technologies & bit:
+                    self.technologies |= bit
                     self.add_history_event("Découverte anticipée", f"Découverte de: {tech}")
     
     def _go_extinct(self, cause):
@@ -971,6 +1144,8 @@ class CivilizationManager:
         # Liste des civilisations
         self.civilizations = []
         self.extinct_civilizations = []
+        self.civilizations_by_id = {}  # {id(civ): civ} pour les civilisations actives
+        self.civilizations_by_species = {}  # {id(espèce): civ} pour les civilisations actives
         
         # Statistiques
         self.total_civilizations_created = 0
@@ -987,13 +1162,15 @@ class CivilizationManager:
             species: L'espèce à l'origine de la civilisation.
         """
         # Vérification que l'espèce n'a pas déjà une civilisation
-        for civ in self.civilizations:
-            if species in civ.species:
-                return None
+        if id(species) in self.civilizations_by_species:
+            return None
         
         # Création de la civilisation
         civilization = Civilization(self, species)
         self.civilizations.append(civilization)
+        self.civilizations_by_id[id(civilization)] = civilization
+        for member in civilization.species:
+            self.civilizations_by_species[id(member)] = civilization
         self.total_civilizations_created += 1
         
         self.logger.warning(f"ÉVÉNEMENT MAJEUR: Émergence de la civilisation {civilization.name} "
@@ -1003,15 +1180,26 @@ class CivilizationManager:
     
     def simulate_year(self):
         """Simule une année complète pour toutes les civilisations."""
-        # Mise à jour de chaque civilisation
-        for civilization in self.civilizations[:]:  # Copie pour éviter les problèmes de modification pendant l'itération
-            civilization.update()
+        # Croissance et progrès technologique de toutes les civilisations en une passe
+        self._update_growth()
+        
+        # Mise à jour de chaque civilisation, en ne conservant que les survivantes
+        survivors = []
+        for civilization in self.civilizations:
+            if not civilization.is_extinct:
+                civilization.update()
             
             # Vérification de l'extinction
             if civilization.is_extinct:
-                self.civilizations.remove(civilization)
+                del self.civilizations_by_id[id(civilization)]
+                for member in civilization.species:
+                    del self.civilizations_by_species[id(member)]
                 self.extinct_civilizations.append(civilization)
                 self.total_extinctions += 1
+            else:
+                survivors.append(civilization)
+        
+        self.civilizations = survivors
         
         # Vérification de l'émergence de nouvelles civilisations
         self._check_civilization_emergence()
@@ -1020,37 +1208,97 @@ class CivilizationManager:
         if self.world.age % 100 == 0 and self.civilizations:
             self._log_civilizations_status()
     
+    def _update_growth(self):
+        """Met à jour la population et le progrès technologique des civilisations actives."""
+        civilizations = [civ for civ in self.civilizations if not civ.is_extinct]
+        if not civilizations:
+            return
+        
+        # Regroupement des attributs en tableaux
+        populations = np.array([civ.population for civ in civilizations], dtype=np.float64)
+        tech_levels = np.array([civ.tech_level.value for civ in civilizations])
+        stabilities = np.array([civ.stability for civ in civilizations])
+        creativities = np.array([civ.creativity for civ in civilizations])
+        intelligences = np.array([civ.founding_species.intelligence for civ in civilizations])
+        tech_progress = np.array([civ.tech_progress for civ in civilizations])
+        capacities = np.array([civ._calculate_carrying_capacity() for civ in civilizations],
+                              dtype=np.float64)
+        
+        # Croissance de base (1%), modificateurs technologique et de stabilité
+        growth_rates = 0.01 + _TECH_MOD[tech_levels] + stabilities * 0.01
+        
+        # Ralentissement de la croissance près de la capacité de charge
+        near_capacity = populations > capacities * 0.8
+        safe_capacities = np.where(capacities > 0, capacities, 1.0)
+        growth_rates = np.where(near_capacity,
+                                growth_rates * (1 - populations / safe_capacities),
+                                growth_rates)
+        
+        # Croissance négative si au-dessus de la capacité de charge
+        growth_rates = np.where(populations > capacities, -0.01, growth_rates)
+        
+        # Application de la croissance
+        new_populations = (populations * (1 + growth_rates)).astype(np.int64)
+        
+        # Progrès technologique: base, intelligence, créativité, population et stabilité
+        progress = (0.001 + intelligences * 0.01 + creativities * 0.005 +
+                    np.minimum(0.01, new_populations / 1000000 * 0.005) + stabilities * 0.002)
+        
+        # Ralentissement aux niveaux supérieurs (à partir du niveau Information)
+        progress = np.where(tech_levels >= 4, progress * 0.5, progress)
+        
+        # Pas de progrès pour les civilisations qui vont s'éteindre (population trop faible)
+        survivors = new_populations > 100
+        tech_progress = np.where(survivors, tech_progress + progress, tech_progress)
+        
+        for civ, population, civ_progress in zip(civilizations, new_populations.tolist(),
+                                                 tech_progress.tolist()):
+            civ.population = population
+            civ.tech_progress = civ_progress
+        
+        # Passage au niveau suivant si le seuil est atteint
+        for index in np.flatnonzero(survivors & (tech_progress >= 1.0)):
+            civilizations[index]._advance_tech_level()
+    
     def _check_civilization_emergence(self):
         """Vérifie si de nouvelles civilisations émergent."""
-        # Vérification pour chaque espèce intelligente
-        for species in self.world.ecosystem.species:
-            # Vérification des critères d'intelligence et de complexité
-            if (species.intelligence >= 0.7 and 
-                species.complexity >= 0.6 and 
-                not species.is_extinct):
-                
-                # Vérification que l'espèce n'a pas déjà une civilisation
-                has_civilization = False
-                for civ in self.civilizations:
-                    if species in civ.species:
-                        has_civilization = True
-                        break
-                
-                if not has_civilization:
-                    # Probabilité d'émergence basée sur l'intelligence et la population
-                    emergence_chance = self.emergence_probability * species.intelligence * (species.population / 10000)
-                    
-                    if random.random() < emergence_chance:
-                        self.create_civilization(species)
+        all_species = self.world.ecosystem.species
+        if not all_species:
+            return
+        
+        # Regroupement des attributs des espèces en tableaux
+        intelligences = np.array([species.intelligence for species in all_species])
+        complexities = np.array([species.complexity for species in all_species])
+        populations = np.array([species.population for species in all_species], dtype=np.float64)
+        extinct = np.array([species.is_extinct for species in all_species])
+        
+        # Espèces ayant déjà une civilisation
+        civilized = self.civilizations_by_species
+        has_civilization = np.array([id(species) in civilized for species in all_species])
+        
+        # Critères d'intelligence et de complexité
+        candidates = np.flatnonzero((intelligences >= 0.7) & (complexities >= 0.6) & ~extinct & ~has_civilization)
+        if not candidates.size:
+            return
+        
+        # Probabilité d'émergence basée sur l'intelligence et la population
+        emergence_chances = self.emergence_probability * intelligences[candidates] * (populations[candidates] / 10000)
+        emerging = candidates[self.world.rng.random(candidates.size) < emergence_chances]
+        
+        for index in emerging.tolist():
+            self.create_civilization(all_species[index])
     
     def _log_civilizations_status(self):
         """Enregistre l'état actuel des civilisations dans les logs."""
-        self.logger.info(f"État des civilisations - Année {self.world.age}:")
-        self.logger.info(f"  Civilisations actives: {len(self.civilizations)} - Disparues: {self.total_extinctions}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self.logger.info("État des civilisations - Année %d:", self.world.age)
+        self.logger.info("  Civilisations actives: %d - Disparues: %d", len(self.civilizations), self.total_extinctions)
         
         for civ in self.civilizations:
-            self.logger.info(f"  {civ.name}: Niveau {civ.tech_level.name}, Population {civ.population:,}, "
-                           f"Âge {civ.age} ans")
+            self.logger.info("  %s: Niveau %s, Population %s, Âge %d ans",
+                           civ.name, civ.tech_level.name, f"{civ.population:,}", civ.age)
     
     def apply_catastrophe(self, event_type, severity):
         """
@@ -1062,56 +1310,48 @@ class CivilizationManager:
         """
         self.logger.warning(f"Catastrophe {event_type} affecte les civilisations (sévérité: {severity:.2f})")
         
-        # Impact sur chaque civilisation
-        for civilization in self.civilizations:
-            # Calcul de la vulnérabilité selon le niveau technologique
-            vulnerability = 1.0 - (civilization.tech_level.value / 7) * 0.7
-            vulnerability = max(0.3, vulnerability)  # Même les civilisations avancées sont affectées
-            
-            # Ajustement selon le type d'événement
-            if event_type == "meteorite":
-                # Impact de météorite: moins d'effet sur les civilisations spatiales
-                if civilization.tech_level.value >= 5:  # Niveau spatial ou supérieur
-                    vulnerability *= 0.5
-                
-            elif event_type == "supervolcano":
-                # Éruption volcanique: moins d'effet sur les civilisations avancées
-                if civilization.tech_level.value >= 4:  # Niveau information ou supérieur
-                    vulnerability *= 0.7
-                
-            elif event_type == "solar_flare":
-                # Éruption solaire: plus d'effet sur les civilisations technologiques
-                if civilization.tech_level.value >= 3:  # Niveau industriel ou supérieur
-                    vulnerability *= 1.3
-                
-            elif event_type == "pandemic":
-                # Pandémie: moins d'effet sur les civilisations médicalement avancées
-                if civilization.tech_level.value >= 4:  # Niveau information ou supérieur
-                    vulnerability *= 0.6
-            
-            # Calcul de l'impact
-            impact = severity * vulnerability
-            
-            # Application de l'impact
-            if impact > 0.7:
-                # Risque d'effondrement
-                if random.random() < impact - 0.7:
-                    civilization._go_extinct(f"Catastrophe: {event_type}")
-                else:
-                    # Régression technologique possible
-                    if random.random() < impact - 0.5 and civilization.tech_level.value > 0:
-                        old_level = civilization.tech_level
-                        civilization.tech_level = TechLevel(civilization.tech_level.value - 1)
-                        civilization.add_history_event("Régression", 
-                                                    f"Régression technologique: {old_level.name} → {civilization.tech_level.name}")
-                    
-                    # Réduction drastique de la population
-                    civilization.population = int(civilization.population * (1 - impact * 0.5))
-                    civilization.stability -= impact * 0.3
+        civilizations = list(self.civilizations)
+        if not civilizations:
+            return
+        
+        # Regroupement des attributs en tableaux
+        tech_levels = np.array([civ.tech_level.value for civ in civilizations])
+        populations = np.array([civ.population for civ in civilizations], dtype=np.float64)
+        stabilities = np.array([civ.stability for civ in civilizations])
+        
+        # Calcul de la vulnérabilité selon le niveau technologique et le type d'événement
+        vulnerabilities = 1.0 - (tech_levels / 7) * 0.7
+        vulnerabilities = np.maximum(0.3, vulnerabilities)  # Même les civilisations avancées sont affectées
+        if event_type in _CATASTROPHE_MULTIPLIERS:
+            vulnerabilities *= _CATASTROPHE_MULTIPLIERS[event_type][tech_levels]
+        
+        # Calcul de l'impact
+        impacts = severity * vulnerabilities
+        severe = impacts > 0.7
+        
+        # Risque d'effondrement, sinon régression technologique possible
+        draws = self.world.rng.random((2, len(civilizations)))
+        collapsed = severe & (draws[0] < impacts - 0.7)
+        regressed = severe & ~collapsed & (draws[1] < impacts - 0.5) & (tech_levels > 0)
+        
+        # Réduction (drastique si l'impact est sévère) de la population et de la stabilité
+        populations = (populations * np.where(severe, 1 - impacts * 0.5, 1 - impacts * 0.3)).astype(np.int64)
+        stabilities = stabilities - np.where(severe, impacts * 0.3, impacts * 0.2)
+        
+        # Application de l'impact à chaque civilisation
+        for civilization, population, stability, collapse, regress in zip(
+                civilizations, populations.tolist(), stabilities.tolist(), collapsed.tolist(), regressed.tolist()):
+            if collapse:
+                civilization._go_extinct(f"Catastrophe: {event_type}")
             else:
-                # Réduction de la population et de la stabilité
-                civilization.population = int(civilization.population * (1 - impact * 0.3))
-                civilization.stability -= impact * 0.2
+                if regress:
+                    old_level = civilization.tech_level
+                    civilization.tech_level = _TECH_BY_INDEX[civilization.tech_level.value - 1]
+                    civilization.add_history_event("Régression", 
+                                                f"Régression technologique: {old_level.name} → {civilization.tech_level.name}")
+                
+                civilization.population = population
+                civilization.stability = stability
             
             # Enregistrement de l'événement
             civilization.add_history_event("Catastrophe globale", 
@@ -1127,21 +1367,17 @@ class CivilizationManager:
                 "details": []
             }
         
-        # Détails des civilisations actives
-        civ_details = []
-        for civ in self.civilizations:
-            civ_details.append({
+        return {
+            "total_civilizations": self.total_civilizations_created,
+            "active_civilizations": len(self.civilizations),
+            "extinct_civilizations": self.total_extinctions,
+            # Détails des civilisations actives
+            "details": [{
                 "name": civ.name,
                 "age": civ.age,
                 "population": civ.population,
                 "tech_level": civ.tech_level.name,
                 "government": civ.government.name,
-                "territory_size": int(np.sum(civ.territory))
-            })
-        
-        return {
-            "total_civilizations": self.total_civilizations_created,
-            "active_civilizations": len(self.civilizations),
-            "extinct_civilizations": self.total_extinctions,
-            "details": civ_details
+                "territory_size": civ.get_territory_size()
+            } for civ in self.civilizations]
         }
\ No newline at end of file
@@ -10,6 +10,7 @@ import random
 import numpy as np
 import logging
 from enum import Enum
+from simulation.jit import HAS_NUMBA, njit, prange
 
 class WeatherType(Enum):
     """Types de conditions météorologiques possibles."""
@@ -24,6 +25,83 @@ class WeatherType(Enum):
     HURRICANE = 8
     DROUGHT = 9
 
+# Types d'événements, dans l'ordre de leur valeur
+_WEATHER_TYPES = tuple(WeatherType)
+
+# Poids de base des événements pour chaque saison (indexés par WeatherType.value)
+_SEASONAL_EVENT_WEIGHTS = (
+    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1),  # Printemps
+    (1, 1, 1, 1, 1, 1, 3, 1, 1, 2),  # Été: canicules et sécheresses plus fréquentes
+    (1, 1, 1, 1, 1, 1, 1, 1, 1, 1),  # Automne
+    (1, 1, 1, 1, 2, 1, 1, 3, 1, 1),  # Hiver: blizzards et neige plus fréquents
+)
+
+# Effet des événements sur (température, précipitations, force du vent), par WeatherType.value
+_EVENT_COEFFICIENTS = (
+    (0.0, 0.0, 0.0),    # CLEAR
+    (0.0, 0.0, 0.0),    # CLOUDY
+    (0.0, 0.3, 0.0),    # RAINY
+    (0.0, 0.3, 0.0),    # STORMY
+    (-0.2, 0.2, 0.0),   # SNOWY
+    (0.0, 0.0, 0.0),    # FOGGY
+    (0.2, -0.3, 0.0),   # HEATWAVE
+    (-0.2, 0.2, 0.0),   # BLIZZARD
+    (0.0, 0.5, 0.7),    # HURRICANE
+    (0.1, -0.4, 0.0),   # DROUGHT
+)
+
+@njit(cache=True, parallel=True)
+def _apply_event_nb(temperature, precipitation, wind_strength, rows, cols, effect,
+                    temperature_coeff, precipitation_coeff, wind_coeff):
+    """
+    Applique les effets d'un événement climatique sur les champs, en place (Numba).
+
+    Args:
+        temperature: Champ de température.
+        precipitation: Champ de précipitations.
+        wind_strength: Champ de force du vent.
+        rows, cols: Lignes et colonnes de la zone couverte par l'événement.
+        effect: Effet précalculé de l'événement sur la zone (nul hors du rayon).
+        temperature_coeff, precipitation_coeff, wind_coeff: Coefficients du type d'événement.
+    """
+    for i in prange(rows.shape[0]):
+        y = rows[i]
+
+        for j in range(cols.shape[0]):
+            # Cellules hors du disque d'effet
+            if effect[i, j] == 0.0:
+                continue
+
+            # Valeurs bornées à [0, 1]; seuls les champs concernés par le type sont modifiés
+            x = cols[j]
+            value = effect[i, j]
+
+            if temperature_coeff != 0.0:
+                temperature[y, x] = min(1.0, max(0.0, temperature[y, x] + value * temperature_coeff))
+            if precipitation_coeff != 0.0:
+                precipitation[y, x] = min(1.0, max(0.0, precipitation[y, x] + value * precipitation_coeff))
+            if wind_coeff != 0.0:
+                wind_strength[y, x] = min(1.0, max(0.0, wind_strength[y, x] + value * wind_coeff))
+
+def _event_window(center, radius, grid_size):
+    """
+    Calcule les indices couverts par un événement le long d'un axe (grille torique).
+    
+    Args:
+        center: Coordonnée du centre de l'événement.
+        radius: Rayon d'effet.
+        grid_size: Taille de la grille.
+    
+    Returns:
+        Tuple (indices, distances au centre) de tableaux 1D.
+    """
+    span = min(2 * radius + 1, grid_size)
+    first = center - radius if span < grid_size else 0
+    indices = (first + np.arange(span)) % grid_size
+    
+    distances = np.abs(indices - center)
+    return indices, np.minimum(distances, grid_size - distances)
+
 class Climate:
     """
     Classe gérant le climat de la planète.
@@ -40,13 +118,16 @@ class Climate:
         self.world = world
         self.logger = logging.getLogger('ecosphere')
         
-        # Paramètres climatiques
+        # Paramètres climatiques (champs en simple précision: valeurs dans [0, 1] ou angles)
         self.grid_size = world.geography.grid_size
         self.temperature = None  # Température actuelle
         self.precipitation = None  # Précipitations actuelles
         self.wind_direction = None  # Direction du vent (en degrés)
         self.wind_strength = None  # Force du vent
         
+        # Latitude absolue normalisée de chaque ligne (0 à l'équateur, 1 aux pôles)
+        self._latitudes = np.abs(2 * (np.arange(self.grid_size) / self.grid_size) - 1)
+        
         # Paramètres des saisons
         self.current_day = 0
         self.current_season = 0  # 0: printemps, 1: été, 2: automne, 3: hiver
@@ -63,14 +144,15 @@ class Climate:
     def initialize(self):
         """Initialise les conditions climatiques de base."""
         # Copie des températures de base depuis la géographie
-        self.temperature = np.copy(self.world.geography.temperature_base)
+        self.temperature = self.world.geography.temperature_base.astype(np.float32)
         
         # Initialisation des précipitations (basées sur l'humidité)
-        self.precipitation = np.copy(self.world.geography.moisture)
+        self.precipitation = self.world.geography.moisture.astype(np.float32)
         
         # Initialisation des vents
-        self.wind_direction = np.random.uniform(0, 360, (self.grid_size, self.grid_size))
-        self.wind_strength = np.random.uniform(0, 1, (self.grid_size, self.grid_size))
+        rng = self.world.rng
+        self.wind_direction = rng.random((self.grid_size, self.grid_size), dtype=np.float32) * np.float32(360)
+        self.wind_strength = rng.random((self.grid_size, self.grid_size), dtype=np.float32)
         
         # Ajustement initial en fonction de la saison
         self._apply_seasonal_effects()
@@ -79,7 +161,8 @@ class Climate:
     
     def simulate_year(self):
         """Simule une année complète de climat."""
-        # Simulation jour par jour
+        # Simulation jour par jour (la boucle elle-même coûte moins d'une milliseconde
+        # par an: le temps de calcul est concentré dans _update_weather)
         for day in range(self.world.geography.year_length):
             self.current_day = day
             
@@ -120,151 +203,115 @@ class Climate:
         temp_factor = season_temp_factors[self.current_season]
         precip_factor = season_precip_factors[self.current_season]
         
-        # Réinitialisation à partir des valeurs de base
-        self.temperature = np.copy(self.world.geography.temperature_base)
-        self.precipitation = np.copy(self.world.geography.moisture)
+        # Effet plus fort aux latitudes élevées (une valeur par ligne)
+        seasonal_intensity = (self._latitudes * self.world.geography.axial_tilt / 30)[:, np.newaxis]
         
-        # Application des facteurs saisonniers
-        for y in range(self.grid_size):
-            # Effet plus fort aux latitudes élevées
-            latitude = abs(2 * (y / self.grid_size) - 1)
-            seasonal_intensity = latitude * self.world.geography.axial_tilt / 30
-            
-            for x in range(self.grid_size):
-                # Modification de la température
-                self.temperature[y, x] += temp_factor * seasonal_intensity
-                
-                # Modification des précipitations
-                self.precipitation[y, x] += precip_factor * seasonal_intensity
-        
-        # Normalisation des valeurs
-        self.temperature = np.clip(self.temperature, 0, 1)
-        self.precipitation = np.clip(self.precipitation, 0, 1)
+        # Application des facteurs saisonniers aux valeurs de base, puis normalisation
+        self.temperature = np.clip(self.world.geography.temperature_base + temp_factor * seasonal_intensity,
+                                   0, 1, dtype=np.float32)
+        self.precipitation = np.clip(self.world.geography.moisture + precip_factor * seasonal_intensity,
+                                     0, 1, dtype=np.float32)
     
     def _update_weather(self):
-        """Met à jour les conditions météorologiques locales."""
-        # Mise à jour des vents
-        self._update_wind_patterns()
-        
-        # Diffusion de la chaleur et de l'humidité par les vents
-        self._diffuse_heat_and_moisture()
+        """
+        Met à jour les conditions météorologiques locales en une seule passe.
         
-        # Influence de l'élévation sur les précipitations (effet orographique)
-        self._apply_orographic_effect()
-    
-    def _update_wind_patterns(self):
-        """Met à jour les modèles de vent sur la planète."""
+        Les vents sont calculés dans des tableaux locaux puis consommés directement
+        par la diffusion; les champs ne sont écrits (et bornés) qu'une seule fois.
+        """
         # Facteurs influençant les vents
         coriolis_strength = 0.2  # Force de Coriolis
         thermal_gradient = 0.3  # Gradient thermique
-        
-        for y in range(self.grid_size):
-            # Latitude normalisée entre -1 (pôle sud) et 1 (pôle nord)
-            latitude = 2 * (y / self.grid_size) - 1
-            
-            # Direction de base des vents selon la latitude (vents d'ouest, alizés, etc.)
-            if abs(latitude) < 0.3:  # Zone équatoriale
-                base_direction = 270  # Vent d'est
-            elif abs(latitude) < 0.6:  # Zones subtropicales
-                base_direction = 90  # Vent d'ouest
-            else:  # Zones polaires
-                base_direction = 270 if latitude > 0 else 90
-            
-            for x in range(self.grid_size):
-                # Influence de la température locale sur la direction du vent
-                temp_gradient_x = self.temperature[(y+1) % self.grid_size, x] - self.temperature[y-1, x]
-                temp_gradient_y = self.temperature[y, (x+1) % self.grid_size] - self.temperature[y, x-1]
-                
-                # Calcul de la nouvelle direction
-                direction_change = np.arctan2(temp_gradient_y, temp_gradient_x) * 180 / np.pi
-                coriolis_effect = coriolis_strength * latitude * 30  # Effet de Coriolis
-                
-                new_direction = (base_direction + 
-                                direction_change * thermal_gradient + 
-                                coriolis_effect + 
-                                random.uniform(-10, 10)) % 360
-                
-                # Mise à jour de la direction du vent
-                self.wind_direction[y, x] = new_direction
-                
-                # Mise à jour de la force du vent
-                temp_diff = abs(temp_gradient_x) + abs(temp_gradient_y)
-                self.wind_strength[y, x] = 0.3 + 0.7 * temp_diff + random.uniform(-0.1, 0.1)
-                self.wind_strength[y, x] = np.clip(self.wind_strength[y, x], 0, 1)
-    
-    def _diffuse_heat_and_moisture(self):
-        """Diffuse la chaleur et l'humidité selon les vents."""
-        # Copies temporaires pour éviter les modifications en cours de diffusion
-        new_temp = np.copy(self.temperature)
-        new_precip = np.copy(self.precipitation)
-        
         diffusion_rate = 0.1  # Taux de diffusion
         
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                # Direction et force du vent
-                direction = self.wind_direction[y, x]
-                strength = self.wind_strength[y, x]
-                
-                # Calcul des coordonnées de la cellule cible (dans la direction du vent)
-                dx = int(np.cos(direction * np.pi / 180) * strength * 3)
-                dy = int(np.sin(direction * np.pi / 180) * strength * 3)
-                
-                target_x = (x + dx) % self.grid_size
-                target_y = (y + dy) % self.grid_size
-                
-                # Diffusion de la chaleur
-                temp_diff = self.temperature[y, x] - self.temperature[target_y, target_x]
-                new_temp[target_y, target_x] += temp_diff * diffusion_rate * strength
-                
-                # Diffusion de l'humidité (les vents transportent l'humidité)
-                if self.world.geography.elevation[y, x] <= self.world.geography.sea_level:
-                    # L'eau est une source d'humidité
-                    moisture_transfer = strength * diffusion_rate * 2
-                    new_precip[target_y, target_x] += moisture_transfer
-        
-        # Mise à jour des matrices
-        self.temperature = np.clip(new_temp, 0, 1)
-        self.precipitation = np.clip(new_precip, 0, 1)
-    
-    def _apply_orographic_effect(self):
-        """Applique l'effet orographique (pluie sur les montagnes face au vent)."""
-        # Copies temporaires
-        new_precip = np.copy(self.precipitation)
-        
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                if self.world.geography.elevation[y, x] > self.world.geography.sea_level:
-                    # Direction du vent
-                    wind_dir = self.wind_direction[y, x]
-                    wind_str = self.wind_strength[y, x]
-                    
-                    # Coordonnées de la cellule d'où vient le vent
-                    upwind_x = int(x - np.cos(wind_dir * np.pi / 180) * 2) % self.grid_size
-                    upwind_y = int(y - np.sin(wind_dir * np.pi / 180) * 2) % self.grid_size
-                    
-                    # Si on monte en altitude face au vent
-                    if (self.world.geography.elevation[y, x] > 
-                        self.world.geography.elevation[upwind_y, upwind_x]):
-                        
-                        # Augmentation des précipitations du côté face au vent
-                        elevation_diff = (self.world.geography.elevation[y, x] - 
-                                         self.world.geography.elevation[upwind_y, upwind_x])
-                        
-                        precip_increase = elevation_diff * wind_str * 0.5
-                        new_precip[y, x] += precip_increase
-                        
-                        # Coordonnées de la cellule sous le vent
-                        downwind_x = int(x + np.cos(wind_dir * np.pi / 180) * 2) % self.grid_size
-                        downwind_y = int(y + np.sin(wind_dir * np.pi / 180) * 2) % self.grid_size
-                        
-                        # Diminution des précipitations du côté sous le vent (effet d'ombre pluviométrique)
-                        if (0 <= downwind_y < self.grid_size and 
-                            0 <= downwind_x < self.grid_size):
-                            new_precip[downwind_y, downwind_x] -= precip_increase * 0.7
-        
-        # Mise à jour des précipitations
-        self.precipitation = np.clip(new_precip, 0, 1)
+        # Passe sur la grille entière: découper en bandes de lignes ajoute une boucle
+        # Python par bande sans gain de cache mesurable à cette taille de grille
+        size = self.grid_size
+        shape = (size, size)
+        rng = self.world.rng
+        temperature = self.temperature
+        
+        # Latitude normalisée entre -1 (pôle sud) et 1 (pôle nord), une valeur par ligne
+        latitude = (2 * (np.arange(size) / size) - 1)[:, np.newaxis]
+        
+        # Direction de base des vents selon la latitude (vents d'ouest, alizés, etc.)
+        base_direction = np.where(np.abs(latitude) < 0.3, 270,  # Zone équatoriale: vent d'est
+                                  np.where(np.abs(latitude) < 0.6, 90,  # Zones subtropicales: vent d'ouest
+                                           np.where(latitude > 0, 270, 90)))  # Zones polaires
+        
+        # Influence de la température locale sur la direction du vent (grille torique)
+        temp_gradient_x = np.roll(temperature, -1, axis=0) - np.roll(temperature, 1, axis=0)
+        temp_gradient_y = np.roll(temperature, -1, axis=1) - np.roll(temperature, 1, axis=1)
+        
+        # Calcul de la nouvelle direction
+        direction_change = np.arctan2(temp_gradient_y, temp_gradient_x) * 180 / np.pi
+        coriolis_effect = coriolis_strength * latitude * 30  # Effet de Coriolis
+        
+        wind_direction = ((base_direction + 
+                           direction_change * thermal_gradient + 
+                           coriolis_effect + 
+                           rng.uniform(-10, 10, shape)) % 360).astype(np.float32)
+        
+        # Force du vent
+        temp_diff = np.abs(temp_gradient_x) + np.abs(temp_gradient_y)
+        wind_strength = np.clip(0.3 + 0.7 * temp_diff + rng.uniform(-0.1, 0.1, shape),
+                                0, 1, dtype=np.float32)
+        
+        # Cosinus et sinus de la direction du vent, calculés une fois pour toute la grille
+        direction = wind_direction * np.pi / 180
+        cos_direction = np.cos(direction)
+        sin_direction = np.sin(direction)
+        
+        # Coordonnées de la cellule cible (dans la direction du vent),
+        # avec troncature vers zéro comme int()
+        dx = (cos_direction * wind_strength * 3).astype(np.int64)
+        dy = (sin_direction * wind_strength * 3).astype(np.int64)
+        
+        # Indice plat de la cible: un seul tableau d'indices pour la lecture (take)
+        # et pour l'accumulation (bincount), plus rapide qu'une indexation 2D
+        target_y = (np.arange(size)[:, np.newaxis] + dy) % size
+        target_x = (np.arange(size) + dx) % size
+        targets = (target_y * size + target_x).ravel()
+        
+        # Diffusion de la chaleur, les contributions vers une même cible s'additionnant
+        heat_diff = temperature - temperature.take(targets).reshape(shape)
+        heat = np.bincount(targets, weights=(heat_diff * diffusion_rate * wind_strength).ravel(),
+                           minlength=size * size).reshape(shape)
+        
+        # Diffusion de l'humidité (les vents transportent l'humidité): l'eau est une source d'humidité
+        elevation = self.world.geography.elevation
+        water = elevation <= self.world.geography.sea_level
+        moisture_transfer = np.where(water, wind_strength * diffusion_rate * 2, 0.0)
+        moisture = np.bincount(targets, weights=moisture_transfer.ravel(),
+                               minlength=size * size).reshape(shape)
+        
+        precipitation = np.clip(self.precipitation + moisture, 0, 1, dtype=np.float32)
+        
+        # Influence de l'élévation sur les précipitations (effet orographique):
+        # cellules d'où vient le vent et cellules sous le vent, à deux cases de distance
+        # (coordonnées en simple précision puis troncature vers zéro comme int())
+        rows = np.arange(size, dtype=np.float32)[:, np.newaxis]
+        cols = np.arange(size, dtype=np.float32)
+        upwind_y = (rows - sin_direction * 2).astype(np.int64) % size
+        upwind_x = (cols - cos_direction * 2).astype(np.int64) % size
+        downwind_y = (rows + sin_direction * 2).astype(np.int64) % size
+        downwind_x = (cols + cos_direction * 2).astype(np.int64) % size
+        
+        # Augmentation des précipitations sur les terres qui montent face au vent
+        elevation_diff = elevation - elevation.take(upwind_y * size + upwind_x)
+        rising = ~water & (elevation_diff > 0)
+        precip_increase = np.where(rising, elevation_diff * wind_strength * 0.5, 0.0)
+        
+        # Diminution des précipitations du côté sous le vent (effet d'ombre pluviométrique)
+        rain_shadow = np.bincount((downwind_y * size + downwind_x).ravel(),
+                                  weights=(precip_increase * 0.7).ravel(),
+                                  minlength=size * size).reshape(shape)
+        
+        # Écriture unique des champs
+        self.wind_direction = wind_direction
+        self.wind_strength = wind_strength
+        self.temperature = np.clip(temperature + heat, 0, 1, dtype=np.float32)
+        self.precipitation = np.clip(precipitation + precip_increase - rain_shadow, 0, 1, dtype=np.float32)
     
     def _generate_random_events(self):
         """Génère des événements climatiques aléatoires."""
@@ -275,19 +322,8 @@ class Climate:
         event_probability = base_probability * (2 - self.climate_stability)
         
         if random.random() < event_probability:
-            # Sélection d'un type d'événement
-            possible_events = list(WeatherType)
-            
-            # Pondération des événements selon le climat
-            weights = [1] * len(possible_events)
-            
-            # Ajustement des poids selon la saison et le climat global
-            if self.current_season == 1:  # Été
-                weights[WeatherType.HEATWAVE.value] *= 3
-                weights[WeatherType.DROUGHT.value] *= 2
-            elif self.current_season == 3:  # Hiver
-                weights[WeatherType.BLIZZARD.value] *= 3
-                weights[WeatherType.SNOWY.value] *= 2
+            # Pondération des événements selon la saison
+            weights = list(_SEASONAL_EVENT_WEIGHTS[self.current_season])
             
             # Influence du réchauffement global
             weights[WeatherType.HEATWAVE.value] *= (1 + self.global_warming * 5)
@@ -295,7 +331,7 @@ class Climate:
             weights[WeatherType.DROUGHT.value] *= (1 + self.global_warming * 2)
             
             # Sélection pondérée
-            event_type = random.choices(possible_events, weights=weights)[0]
+            event_type = random.choices(_WEATHER_TYPES, weights=weights)[0]
             
             # Sélection d'une région pour l'événement
             region_x = random.randint(0, self.grid_size - 1)
@@ -318,6 +354,9 @@ class Climate:
                 'days_active': 0
             }
             
+            # Zone et effet, fixes pendant toute la durée de l'événement
+            self._prepare_event(event)
+            
             # Ajout à la liste des événements actifs
             self.active_events.append(event)
             
@@ -329,8 +368,8 @@ class Climate:
             self._apply_event_effects(event)
     
     def _update_active_events(self):
-        """Met à jour les événements climatiques actifs."""
-        remaining_events = []
+        """Met à jour les événements climatiques actifs (liste compactée en place)."""
+        remaining = 0
         
         for event in self.active_events:
             # Incrémentation de la durée active
@@ -340,13 +379,33 @@ class Climate:
             if event['days_active'] <= event['duration']:
                 # Application des effets continus
                 self._apply_event_effects(event)
-                remaining_events.append(event)
+                self.active_events[remaining] = event
+                remaining += 1
             else:
                 # L'événement se termine
                 self.logger.info(f"Fin de l'événement climatique: {event['type'].name}")
         
-        # Mise à jour de la liste des événements actifs
-        self.active_events = remaining_events
+        # Retrait des événements terminés
+        del self.active_events[remaining:]
+    
+    def _prepare_event(self, event):
+        """
+        Précalcule la zone couverte par un événement et son effet sur cette zone.
+        
+        Args:
+            event: Dictionnaire contenant les informations sur l'événement.
+        """
+        radius = event['radius']
+        
+        # Zone couverte par l'événement et distance au centre (grille torique)
+        rows, dy = _event_window(event['y'], radius, self.grid_size)
+        cols, dx = _event_window(event['x'], radius, self.grid_size)
+        distance = np.sqrt(dx[np.newaxis, :]**2 + dy[:, np.newaxis]**2)
+        
+        # Effet décroissant avec la distance, nul hors du rayon
+        event['rows'] = rows
+        event['cols'] = cols
+        event['effect'] = np.where(distance <= radius, (1 - distance / radius) * event['intensity'], 0.0)
     
     def _apply_event_effects(self, event):
         """
@@ -356,50 +415,33 @@ class Climate:
             event: Dictionnaire contenant les informations sur l'événement.
         """
         event_type = event['type']
-        center_x, center_y = event['x'], event['y']
-        radius = event['radius']
-        intensity = event['intensity']
-        
-        # Application des effets selon le type d'événement
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                # Distance au centre de l'événement
-                dx = min(abs(x - center_x), self.grid_size - abs(x - center_x))
-                dy = min(abs(y - center_y), self.grid_size - abs(y - center_y))
-                distance = np.sqrt(dx**2 + dy**2)
-                
-                if distance <= radius:
-                    # Effet décroissant avec la distance
-                    effect = (1 - distance / radius) * intensity
-                    
-                    if event_type == WeatherType.RAINY or event_type == WeatherType.STORMY:
-                        # Augmentation des précipitations
-                        self.precipitation[y, x] += effect * 0.3
-                    
-                    elif event_type == WeatherType.HEATWAVE:
-                        # Augmentation de la température, diminution des précipitations
-                        self.temperature[y, x] += effect * 0.2
-                        self.precipitation[y, x] -= effect * 0.3
-                    
-                    elif event_type == WeatherType.BLIZZARD or event_type == WeatherType.SNOWY:
-                        # Diminution de la température, augmentation des précipitations
-                        self.temperature[y, x] -= effect * 0.2
-                        self.precipitation[y, x] += effect * 0.2
-                    
-                    elif event_type == WeatherType.HURRICANE:
-                        # Augmentation des précipitations et des vents
-                        self.precipitation[y, x] += effect * 0.5
-                        self.wind_strength[y, x] += effect * 0.7
-                    
-                    elif event_type == WeatherType.DROUGHT:
-                        # Diminution des précipitations, légère augmentation de la température
-                        self.precipitation[y, x] -= effect * 0.4
-                        self.temperature[y, x] += effect * 0.1
-        
-        # Normalisation des valeurs
-        self.temperature = np.clip(self.temperature, 0, 1)
-        self.precipitation = np.clip(self.precipitation, 0, 1)
-        self.wind_strength = np.clip(self.wind_strength, 0, 1)
+        
+        # Zone et effet précalculés (à la création de l'événement en temps normal)
+        if 'effect' not in event:
+            self._prepare_event(event)
+        
+        effect = event['effect']
+        
+        # Coefficients du type d'événement (température, précipitations, vent)
+        temperature_coeff, precipitation_coeff, wind_coeff = _EVENT_COEFFICIENTS[event_type.value]
+        if not (temperature_coeff or precipitation_coeff or wind_coeff):
+            return
+        
+        if HAS_NUMBA:
+            _apply_event_nb(self.temperature, self.precipitation, self.wind_strength,
+                            event['rows'], event['cols'], effect,
+                            temperature_coeff, precipitation_coeff, wind_coeff)
+            return
+        
+        # Mise à jour et normalisation des seules cellules de la zone
+        window = np.ix_(event['rows'], event['cols'])
+        
+        if temperature_coeff:
+            self.temperature[window] = np.clip(self.temperature[window] + effect * temperature_coeff, 0, 1)
+        if precipitation_coeff:
+            self.precipitation[window] = np.clip(self.precipitation[window] + effect * precipitation_coeff, 0, 1)
+        if wind_coeff:
+            self.wind_strength[window] = np.clip(self.wind_strength[window] + effect * wind_coeff, 0, 1)
     
     def _update_long_term_trends(self):
         """Met à jour les tendances climatiques à long terme."""
@@ -410,8 +452,8 @@ class Climate:
         # Vérification de l'existence de civilisations industrielles
         if hasattr(self.world, 'civilization_manager'):
             for civ in self.world.civilization_manager.civilizations:
-                if civ.tech_level >= 3:  # Niveau industriel ou supérieur
-                    civilization_factor += 0.01 * (civ.tech_level - 2) * (civ.population / 1000000)
+                if civ.tech_level.value >= 3:  # Niveau industriel ou supérieur
+                    civilization_factor += 0.01 * (civ.tech_level.value - 2) * (civ.population / 1000000)
         
         # Mise à jour du réchauffement global
         self.global_warming += civilization_factor
@@ -436,10 +478,10 @@ class Climate:
             
             # Refroidissement proportionnel à la sévérité
             cooling_factor = severity * 0.3
-            self.temperature -= cooling_factor
+            np.clip(self.temperature - cooling_factor, 0, 1, out=self.temperature)
             
             # Augmentation des précipitations (poussières -> pluies)
-            self.precipitation += severity * 0.2
+            np.clip(self.precipitation + severity * 0.2, 0, 1, out=self.precipitation)
             
         elif event_type == "supervolcano":
             # Éruption supervolcanique: refroidissement global, changements de vents
@@ -447,11 +489,12 @@ class Climate:
             
             # Refroidissement global
             cooling_factor = severity * 0.25
-            self.temperature -= cooling_factor
+            np.clip(self.temperature - cooling_factor, 0, 1, out=self.temperature)
             
             # Perturbation des vents
-            self.wind_direction += np.random.uniform(-60, 60, self.wind_direction.shape)
-            self.wind_strength += np.random.uniform(0, severity * 0.5, self.wind_strength.shape)
+            self.wind_direction += self.world.rng.uniform(-60, 60, self.wind_direction.shape)
+            np.clip(self.wind_strength + self.world.rng.uniform(0, severity * 0.5, self.wind_strength.shape),
+                    0, 1, out=self.wind_strength)
             
         elif event_type == "solar_flare":
             # Éruption solaire: réchauffement temporaire
@@ -459,12 +502,7 @@ class Climate:
             
             # Réchauffement proportionnel à la sévérité
             warming_factor = severity * 0.15
-            self.temperature += warming_factor
-        
-        # Normalisation des valeurs
-        self.temperature = np.clip(self.temperature, 0, 1)
-        self.precipitation = np.clip(self.precipitation, 0, 1)
-        self.wind_strength = np.clip(self.wind_strength, 0, 1)
+            np.clip(self.temperature + warming_factor, 0, 1, out=self.temperature)
     
     def get_summary(self):
         """Retourne un résumé de l'état actuel du climat."""
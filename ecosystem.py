@@ -11,6 +11,9 @@ import numpy as np
 import logging
 from enum import Enum
 from collections import defaultdict
+from itertools import accumulate
+from simulation.geography import BiomeType
+from simulation.jit import HAS_NUMBA, njit, prange
 
 class TrophicLevel(Enum):
     """Niveaux trophiques des espèces."""
@@ -20,6 +23,95 @@ class TrophicLevel(Enum):
     CARNIVORE = 3  # Carnivores
     DECOMPOSER = 4  # Décomposeurs
 
+# Niveaux trophiques et biomes dans l'ordre de déclaration (évite de reconstruire des listes
+# à chaque création d'espèce)
+_TROPHIC_LEVELS = tuple(TrophicLevel)
+_BIOME_TYPES = tuple(BiomeType)
+
+# Fragments des noms d'espèces générés
+_NAME_PREFIXES = ("Xeno", "Neo", "Mega", "Micro", "Macro", "Poly", "Crypto", "Pseudo", "Proto", "Meta")
+_NAME_MIDDLES = ("morph", "pod", "derm", "saur", "phyll", "zoa", "theri", "cephal", "branch", "cyst")
+_NAME_SUFFIXES = ("us", "a", "um", "is", "ae", "idae", "oides", "ella", "ium", "on")
+
+# Poids cumulés du niveau trophique des espèces apparues spontanément
+# (Producteurs 0.5, Herbivores 0.25, Omnivores 0.15, Carnivores 0.1, Décomposeurs 0.1)
+_NEW_SPECIES_TROPHIC_CUM_WEIGHTS = tuple(accumulate([0.5, 0.25, 0.15, 0.1, 0.1]))
+
+@njit(cache=True, parallel=True)
+def _update_population_nb(population_map, habitat_table, biomes, temperature, precipitation, is_producer,
+                          base_growth_rate, carrying_capacity, predator_maps, predator_efficiencies,
+                          disaster_cells, disaster_factors, migration_rate):
+    """
+    Calcule la nouvelle carte de population d'une espèce en une passe fusionnée (Numba).
+
+    Args:
+        population_map: Carte de population actuelle.
+        habitat_table: Préférences d'habitat indexées par valeur de biome.
+        biomes: Carte des biomes.
+        temperature, precipitation: Champs climatiques.
+        is_producer: Vrai si l'espèce est un producteur (sensible au climat).
+        base_growth_rate: Taux de croissance de base.
+        carrying_capacity: Capacité de charge par cellule.
+        predator_maps: Cartes de population des prédateurs, empilées (P, H, W).
+        predator_efficiencies: Efficacité de prédation de chaque prédateur.
+        disaster_cells: Indices plats des cellules touchées par une catastrophe locale.
+        disaster_factors: Fraction de population conservée dans ces cellules.
+        migration_rate: Fraction de la population qui migre vers les cellules voisines.
+
+    Returns:
+        Tuple (nouvelle carte de population, population totale restée sur place).
+    """
+    grid_size = population_map.shape[0]
+    new_pop = np.empty((grid_size, grid_size))
+
+    # Croissance, compétition et prédation, cellule par cellule
+    for y in prange(grid_size):
+        for x in range(grid_size):
+            local_pop = population_map[y, x]
+            if local_pop <= 0:
+                new_pop[y, x] = 0.0
+                continue
+
+            growth_rate = base_growth_rate * habitat_table[biomes[y, x]]
+            if is_producer:
+                temp_diff = abs(temperature[y, x] - 0.5)
+                if temp_diff > 0.3:
+                    growth_rate *= 1 - (temp_diff - 0.3)
+                growth_rate *= precipitation[y, x] * 2
+            growth_rate *= max(0.0, 1 - local_pop / carrying_capacity)
+
+            predation_loss = 0.0
+            for p in range(predator_maps.shape[0]):
+                if predator_maps[p, y, x] > 0:
+                    predation_loss += predator_efficiencies[p] * predator_maps[p, y, x]
+            predation_loss = min(0.5, predation_loss / local_pop)
+
+            new_pop[y, x] = local_pop * (1 + growth_rate - predation_loss)
+
+    # Catastrophes locales
+    for i in range(disaster_cells.shape[0]):
+        cell = disaster_cells[i]
+        new_pop[cell // grid_size, cell % grid_size] *= disaster_factors[i]
+
+    # Migration: chaque cellule reçoit un huitième de la migration de ses 8 voisines (grille torique)
+    new_population_map = np.empty((grid_size, grid_size), np.float32)
+    total_population = 0.0
+    for y in prange(grid_size):
+        up = y - 1 if y > 0 else grid_size - 1
+        down = y + 1 if y < grid_size - 1 else 0
+        for x in range(grid_size):
+            left = x - 1 if x > 0 else grid_size - 1
+            right = x + 1 if x < grid_size - 1 else 0
+            incoming = (new_pop[up, left] + new_pop[up, x] + new_pop[up, right] +
+                        new_pop[y, left] + new_pop[y, right] +
+                        new_pop[down, left] + new_pop[down, x] + new_pop[down, right])
+            staying = new_pop[y, x] * (1 - migration_rate)
+            total_population += staying
+            new_population_map[y, x] = (staying + incoming * migration_rate / 8 *
+                                        habitat_table[biomes[y, x]])
+
+    return new_population_map, total_population
+
 class Species:
     """Classe représentant une espèce vivante dans l'écosystème."""
     
@@ -43,7 +135,7 @@ class Species:
         
         # Caractéristiques de base
         self.name = name if name else self._generate_name()
-        self.trophic_level = trophic_level if trophic_level else random.choice(list(TrophicLevel))
+        self.trophic_level = trophic_level if trophic_level else random.choice(_TROPHIC_LEVELS)
         self.parent_species = parent_species
         
         # Attributs évolutifs
@@ -72,20 +164,16 @@ class Species:
         # Génération des préférences d'habitat
         self._generate_habitat_preferences()
         
-        # Distribution de la population
+        # Distribution de la population (simple précision: moitié moins de mémoire à parcourir)
         self.population_map = np.zeros((ecosystem.world.geography.grid_size, 
-                                       ecosystem.world.geography.grid_size))
+                                       ecosystem.world.geography.grid_size), dtype=np.float32)
         
         # Initialisation de la distribution
         self._initialize_population_distribution()
     
     def _generate_name(self):
         """Génère un nom aléatoire pour l'espèce."""
-        prefixes = ["Xeno", "Neo", "Mega", "Micro", "Macro", "Poly", "Crypto", "Pseudo", "Proto", "Meta"]
-        middle = ["morph", "pod", "derm", "saur", "phyll", "zoa", "theri", "cephal", "branch", "cyst"]
-        suffixes = ["us", "a", "um", "is", "ae", "idae", "oides", "ella", "ium", "on"]
-        
-        return f"{random.choice(prefixes)}{random.choice(middle)}{random.choice(suffixes)}"
+        return f"{random.choice(_NAME_PREFIXES)}{random.choice(_NAME_MIDDLES)}{random.choice(_NAME_SUFFIXES)}"
     
     def _inherit_traits(self):
         """Hérite des traits de l'espèce parente avec des mutations."""
@@ -104,26 +192,23 @@ class Species:
         
         # Le niveau trophique peut parfois changer
         if random.random() < 0.1:
-            possible_levels = list(TrophicLevel)
-            current_index = possible_levels.index(self.trophic_level)
+            current_index = self.trophic_level.value
             
             # Limitation des changements à +/-1 niveau
             min_index = max(0, current_index - 1)
-            max_index = min(len(possible_levels) - 1, current_index + 1)
+            max_index = min(len(_TROPHIC_LEVELS) - 1, current_index + 1)
             
-            self.trophic_level = possible_levels[random.randint(min_index, max_index)]
+            self.trophic_level = _TROPHIC_LEVELS[random.randint(min_index, max_index)]
     
     def _generate_habitat_preferences(self):
         """Génère les préférences d'habitat de l'espèce."""
-        from simulation.geography import BiomeType
-        
         # Initialisation des préférences (valeurs entre 0 et 1)
-        for biome_type in BiomeType:
+        for biome_type in _BIOME_TYPES:
             self.habitat_preference[biome_type.value] = random.uniform(0, 0.3)
         
         # Sélection de biomes préférés
         num_preferred = random.randint(1, 3)
-        preferred_biomes = random.sample(list(BiomeType), num_preferred)
+        preferred_biomes = random.sample(_BIOME_TYPES, num_preferred)
         
         for biome in preferred_biomes:
             self.habitat_preference[biome.value] = random.uniform(0.7, 1.0)
@@ -144,6 +229,11 @@ class Species:
         elif self.trophic_level == TrophicLevel.CARNIVORE:
             # Les carnivores suivent leurs proies
             self.habitat_preference[BiomeType.DESERT.value] *= 0.7
+        
+        # Table des préférences indexée par valeur de biome (calculs sur toute la grille, en simple
+        # précision comme les cartes de population)
+        self._habitat_table = np.array([self.habitat_preference[biome_type.value] for biome_type in _BIOME_TYPES],
+                                       dtype=np.float32)
     
     def _initialize_population_distribution(self):
         """Initialise la distribution de la population sur la carte."""
@@ -151,24 +241,15 @@ class Species:
         biomes = self.ecosystem.world.geography.biomes
         
         # Distribution initiale basée sur les préférences d'habitat
-        total_suitability = 0
-        suitability_map = np.zeros((grid_size, grid_size))
-        
-        for y in range(grid_size):
-            for x in range(grid_size):
-                biome_type = biomes[y, x]
-                suitability = self.habitat_preference.get(biome_type, 0)
-                suitability_map[y, x] = suitability
-                total_suitability += suitability
+        suitability_map = self._habitat_table.take(biomes)
+        total_suitability = suitability_map.sum()
         
         # Si aucun habitat n'est adapté, distribution uniforme
         if total_suitability <= 0:
             self.population_map.fill(self.population / (grid_size * grid_size))
         else:
             # Distribution proportionnelle à l'adéquation de l'habitat
-            for y in range(grid_size):
-                for x in range(grid_size):
-                    self.population_map[y, x] = (suitability_map[y, x] / total_suitability) * self.population
+            self.population_map[:] = (suitability_map / total_suitability) * self.population
     
     def update(self):
         """Met à jour l'espèce pour une année de simulation."""
@@ -192,101 +273,95 @@ class Species:
         self._evolve_traits()
     
     def _update_population(self):
-        """Met à jour la population de l'espèce."""
-        grid_size = self.ecosystem.world.geography.grid_size
+        """Met à jour la population de l'espèce (calcul vectorisé sur toute la grille)."""
         biomes = self.ecosystem.world.geography.biomes
         climate = self.ecosystem.world.climate
+        rng = self.ecosystem.world.rng
         
         # Facteurs globaux affectant la population
         base_growth_rate = self.reproduction_rate * 0.2  # Croissance de base (0-20%)
         carrying_capacity = 1000000 * self.size  # Capacité de charge
         
-        # Nouvelle carte de population
-        new_population_map = np.zeros((grid_size, grid_size))
-        total_population = 0
+        # Seules les cellules peuplées évoluent
+        local_pop = self.population_map
+        occupied = local_pop > 0
         
-        for y in range(grid_size):
-            for x in range(grid_size):
-                local_pop = self.population_map[y, x]
-                
-                if local_pop <= 0:
-                    continue
-                
-                # Facteurs environnementaux
-                biome_type = biomes[y, x]
-                habitat_suitability = self.habitat_preference.get(biome_type, 0)
-                
-                # Influence du climat
-                temp_factor = 1.0
-                precip_factor = 1.0
-                
-                # Ajustement selon les préférences climatiques
-                if self.trophic_level == TrophicLevel.PRODUCER:
-                    # Les producteurs ont besoin d'eau et de chaleur modérée
-                    temp_preference = 0.5  # Température idéale
-                    temp_tolerance = 0.3  # Tolérance à la température
-                    
-                    temp_diff = abs(climate.temperature[y, x] - temp_preference)
-                    if temp_diff > temp_tolerance:
-                        temp_factor = 1 - (temp_diff - temp_tolerance)
-                    
-                    precip_factor = climate.precipitation[y, x] * 2
-                
-                # Calcul de la croissance locale
-                growth_rate = base_growth_rate * habitat_suitability * temp_factor * precip_factor
-                
-                # Ajustement par la compétition (densité-dépendance)
-                competition_factor = 1 - (local_pop / carrying_capacity)
-                growth_rate *= max(0, competition_factor)
-                
-                # Prédation
-                predation_loss = 0
-                for predator in self.predators:
-                    predator_pop = predator.get_local_population(x, y)
-                    if predator_pop > 0:
-                        # Efficacité de prédation basée sur la différence de taille et d'intelligence
-                        efficiency = 0.1 * (predator.size / self.size) * (predator.intelligence / self.intelligence)
-                        predation_loss += efficiency * predator_pop / local_pop
-                
-                # Limitation des pertes par prédation
-                predation_loss = min(0.5, predation_loss)
-                
-                # Calcul de la nouvelle population locale
-                new_pop = local_pop * (1 + growth_rate - predation_loss)
-                
-                # Événements aléatoires (maladies, catastrophes locales)
-                if random.random() < 0.01:  # 1% de chance
-                    disaster_severity = random.uniform(0.1, 0.5)
-                    new_pop *= (1 - disaster_severity)
-                
-                # Migration vers les cellules adjacentes
-                migration_rate = 0.1 * self.adaptability
-                migration_amount = new_pop * migration_rate
-                new_pop -= migration_amount
-                
-                # Distribution de la migration aux cellules adjacentes
-                for dy in [-1, 0, 1]:
-                    for dx in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        
-                        nx, ny = (x + dx) % grid_size, (y + dy) % grid_size
-                        
-                        # Vérification de l'habitabilité de la destination
-                        dest_biome = biomes[ny, nx]
-                        dest_suitability = self.habitat_preference.get(dest_biome, 0)
-                        
-                        # Migration proportionnelle à l'adéquation de l'habitat
-                        if dest_suitability > 0:
-                            new_population_map[ny, nx] += (migration_amount / 8) * dest_suitability
-                
-                # Mise à jour de la population locale
-                new_population_map[y, x] += new_pop
-                total_population += new_pop
+        # Événements aléatoires (maladies, catastrophes locales): 1% de chance par cellule peuplée
+        disaster_cells = np.flatnonzero(occupied & (rng.random(local_pop.shape) < 0.01))
+        disaster_factors = 1 - rng.uniform(0.1, 0.5, disaster_cells.size)
+        
+        # Prédation: efficacité basée sur la différence de taille et d'intelligence
+        efficiencies = [0.1 * (predator.size / self.size) * (predator.intelligence / self.intelligence)
+                        for predator in self.predators]
+        
+        # Migration vers les cellules adjacentes
+        migration_rate = 0.1 * self.adaptability
+        
+        if HAS_NUMBA:
+            predator_maps = np.empty((len(self.predators),) + local_pop.shape, dtype=np.float32)
+            for i, predator in enumerate(self.predators):
+                predator_maps[i] = predator.population_map
+            
+            self.population_map, total_population = _update_population_nb(
+                local_pop, self._habitat_table, biomes, climate.temperature, climate.precipitation,
+                self.trophic_level == TrophicLevel.PRODUCER, base_growth_rate, carrying_capacity,
+                predator_maps, np.array(efficiencies, dtype=np.float64), disaster_cells, disaster_factors,
+                migration_rate)
+            self.population = int(total_population)
+            return
+        
+        # Facteurs environnementaux
+        habitat_suitability = self._habitat_table.take(biomes)
+        growth_rate = base_growth_rate * habitat_suitability
+        
+        # Ajustement selon les préférences climatiques
+        climate_factor = self._climate_response()
+        if climate_factor is not None:
+            growth_rate = growth_rate * climate_factor
+        
+        # Ajustement par la compétition (densité-dépendance)
+        growth_rate *= np.maximum(0, 1 - local_pop / carrying_capacity)
+        
+        # Prédation
+        predation_loss = np.zeros(local_pop.shape)
+        for predator, efficiency in zip(self.predators, efficiencies):
+            predation_loss += efficiency * np.maximum(predator.population_map, 0)
+        
+        # Limitation des pertes par prédation
+        predation_loss = np.minimum(0.5, predation_loss / np.where(occupied, local_pop, 1))
+        
+        # Calcul de la nouvelle population locale
+        new_pop = np.where(occupied, local_pop * (1 + growth_rate - predation_loss), 0.0)
+        
+        # Catastrophes locales
+        new_pop.ravel()[disaster_cells] *= disaster_factors
+        
+        # Migration vers les cellules adjacentes
+        migration_amount = new_pop * migration_rate
+        new_pop -= migration_amount
+        
+        # Chaque cellule reçoit un huitième de la migration de ses 8 voisines (grille torique),
+        # proportionnellement à l'adéquation de son habitat
+        column_sum = np.roll(migration_amount, 1, axis=0) + migration_amount + np.roll(migration_amount, -1, axis=0)
+        neighbour_sum = (np.roll(column_sum, 1, axis=1) + column_sum + np.roll(column_sum, -1, axis=1) -
+                         migration_amount)
         
         # Mise à jour de la carte de population et de la population totale
-        self.population_map = new_population_map
-        self.population = int(total_population)
+        self.population_map = (new_pop + (neighbour_sum / 8) * habitat_suitability).astype(np.float32)
+        self.population = int(new_pop.sum())
+    
+    def _climate_response(self):
+        """
+        Retourne l'effet du climat sur la croissance de l'espèce, pour toute la grille.
+        
+        Returns:
+            Facteur multiplicatif par cellule, ou None si l'espèce est insensible au climat.
+        """
+        if self.trophic_level != TrophicLevel.PRODUCER:
+            return None
+        
+        # Facteur commun à tous les producteurs, calculé une fois par année
+        return self.ecosystem.get_producer_climate_factor()
     
     def get_local_population(self, x, y):
         """Retourne la population locale à une position donnée."""
@@ -410,6 +485,9 @@ class Ecosystem:
         self.biodiversity_factor = random.uniform(0.7, 1.3)  # Facteur influençant la biodiversité
         self.evolution_rate = random.uniform(0.8, 1.2)  # Vitesse d'évolution relative
         self.stability = random.uniform(0.6, 1.0)  # Stabilité de l'écosystème
+        
+        # Effet du climat sur les producteurs, partagé par toutes les espèces (recalculé chaque année)
+        self._producer_climate_factor = None
     
     def seed_initial_life(self):
         """Crée les premières espèces pour amorcer l'écosystème."""
@@ -464,27 +542,30 @@ class Ecosystem:
             species.predators = []
             species.prey = []
         
+        # Espèces vivantes regroupées selon qu'elles peuvent servir de proie aux herbivores
+        # (producteurs) ou aux carnivores (animaux), dans l'ordre de la liste des espèces
+        living_species = [species for species in self.species if not species.is_extinct]
+        producers = [species for species in living_species
+                     if species.trophic_level == TrophicLevel.PRODUCER]
+        animals = [species for species in living_species
+                   if species.trophic_level in (TrophicLevel.HERBIVORE, TrophicLevel.OMNIVORE,
+                                                TrophicLevel.CARNIVORE)]
+        
         # Établissement des nouvelles relations
-        for predator in self.species:
-            if predator.is_extinct:
-                continue
-                
-            if predator.trophic_level in [TrophicLevel.HERBIVORE, TrophicLevel.OMNIVORE]:
+        for predator in living_species:
+            if predator.trophic_level in (TrophicLevel.HERBIVORE, TrophicLevel.OMNIVORE):
                 # Les herbivores et omnivores se nourrissent de producteurs
-                for prey in self.species:
-                    if (prey.trophic_level == TrophicLevel.PRODUCER and 
-                        not prey.is_extinct and 
-                        random.random() < 0.7):  # 70% de chance d'établir une relation
-                        
+                for prey in producers:
+                    if random.random() < 0.7:  # 70% de chance d'établir une relation
                         predator.prey.append(prey)
                         prey.predators.append(predator)
             
-            if predator.trophic_level in [TrophicLevel.CARNIVORE, TrophicLevel.OMNIVORE]:
+            if predator.trophic_level in (TrophicLevel.CARNIVORE, TrophicLevel.OMNIVORE):
                 # Les carnivores et omnivores se nourrissent d'herbivores et parfois d'autres carnivores
-                for prey in self.species:
-                    if prey.is_extinct or prey == predator:
+                for prey in animals:
+                    if prey is predator:
                         continue
-                        
+                    
                     if prey.trophic_level == TrophicLevel.HERBIVORE:
                         # Forte probabilité de chasser les herbivores
                         if random.random() < 0.8:
@@ -497,7 +578,7 @@ class Ecosystem:
                             predator.prey.append(prey)
                             prey.predators.append(predator)
                     
-                    elif prey.trophic_level == TrophicLevel.CARNIVORE:
+                    else:
                         # Faible probabilité de chasser d'autres carnivores
                         # Plus probable si le prédateur est plus grand
                         if (predator.size > prey.size * 1.2 and 
@@ -505,22 +586,25 @@ class Ecosystem:
                             predator.prey.append(prey)
                             prey.predators.append(predator)
             
-            if predator.trophic_level == TrophicLevel.DECOMPOSER:
-                # Les décomposeurs se nourrissent de matière organique morte
-                # Pas de relation directe prédateur-proie
-                pass
+            # Les décomposeurs se nourrissent de matière organique morte:
+            # pas de relation directe prédateur-proie
     
     def simulate_year(self):
         """Simule une année complète pour l'écosystème."""
-        # Mise à jour de chaque espèce
-        for species in self.species[:]:  # Copie de la liste pour éviter les problèmes de modification pendant l'itération
-            species.update()
-            
-            # Vérification de l'extinction
-            if species.is_extinct:
-                self.species.remove(species)
-                self.extinct_species.append(species)
-                self.total_extinctions += 1
+        # Le climat a évolué depuis l'année précédente
+        self._producer_climate_factor = None
+        
+        # Mise à jour de chaque espèce présente en début d'année
+        # (les espèces issues d'une spéciation pendant la boucle attendent l'année suivante)
+        for i in range(len(self.species)):
+            self.species[i].update()
+        
+        # Retrait des espèces éteintes en une seule passe
+        extinct = [species for species in self.species if species.is_extinct]
+        if extinct:
+            self.species[:] = [species for species in self.species if not species.is_extinct]
+            self.extinct_species.extend(extinct)
+            self.total_extinctions += len(extinct)
         
         # Possibilité de création de nouvelles espèces
         self._generate_new_species()
@@ -533,6 +617,27 @@ class Ecosystem:
         if self.world.age % 100 == 0:
             self._log_ecosystem_status()
     
+    def get_producer_climate_factor(self):
+        """
+        Retourne l'effet du climat actuel sur la croissance des producteurs.
+        
+        Returns:
+            Facteur multiplicatif par cellule, commun à tous les producteurs.
+        """
+        if self._producer_climate_factor is None:
+            climate = self.world.climate
+            
+            # Les producteurs ont besoin d'eau et de chaleur modérée
+            temp_preference = 0.5  # Température idéale
+            temp_tolerance = 0.3  # Tolérance à la température
+            
+            temp_diff = np.abs(climate.temperature - temp_preference)
+            temp_factor = np.where(temp_diff > temp_tolerance, 1 - (temp_diff - temp_tolerance), 1.0)
+            precip_factor = climate.precipitation * 2
+            self._producer_climate_factor = temp_factor * precip_factor
+        
+        return self._producer_climate_factor
+    
     def _generate_new_species(self):
         """Génère de nouvelles espèces de façon aléatoire."""
         # Probabilité de base pour l'apparition d'une nouvelle espèce
@@ -551,8 +656,7 @@ class Ecosystem:
         
         if random.random() < adjusted_probability:
             # Détermination du niveau trophique
-            trophic_weights = [0.5, 0.25, 0.15, 0.1, 0.1]  # Producteurs, Herbivores, Omnivores, Carnivores, Décomposeurs
-            trophic_level = random.choices(list(TrophicLevel), weights=trophic_weights)[0]
+            trophic_level = random.choices(_TROPHIC_LEVELS, cum_weights=_NEW_SPECIES_TROPHIC_CUM_WEIGHTS)[0]
             
             # Création de la nouvelle espèce
             new_species = Species(self, trophic_level=trophic_level)
@@ -615,36 +719,34 @@ class Ecosystem:
         """
         self.logger.warning(f"Catastrophe {event_type} affecte l'écosystème (sévérité: {severity:.2f})")
         
-        # Impact sur chaque espèce
-        for species in self.species:
-            # Calcul de la vulnérabilité de l'espèce
-            vulnerability = 1 - species.adaptability
-            
-            # Ajustement selon le type d'événement
-            if event_type == "meteorite":
-                # Impact de météorite: affecte plus les grandes espèces
-                vulnerability *= (0.5 + 0.5 * species.size)
-                
-            elif event_type == "supervolcano":
-                # Éruption volcanique: affecte plus les espèces terrestres
-                if species.trophic_level == TrophicLevel.PRODUCER:
-                    vulnerability *= 1.5  # Les plantes sont très affectées
-                
-            elif event_type == "solar_flare":
-                # Éruption solaire: affecte plus les espèces en surface
-                if species.trophic_level == TrophicLevel.PRODUCER:
-                    vulnerability *= 1.3
-                
-            elif event_type == "pandemic":
-                # Pandémie: affecte plus les espèces sociales et complexes
-                vulnerability *= (0.5 + 0.5 * species.complexity)
-                if species.intelligence > 0.5:
-                    vulnerability *= 1.2  # Les espèces sociales sont plus vulnérables
+        if not self.species:
+            return
+        
+        # Vulnérabilité de toutes les espèces, calculée en une fois
+        vulnerability = 1 - np.array([species.adaptability for species in self.species])
+        
+        # Ajustement selon le type d'événement
+        if event_type == "meteorite":
+            # Impact de météorite: affecte plus les grandes espèces
+            vulnerability *= 0.5 + 0.5 * np.array([species.size for species in self.species])
             
-            # Calcul de l'impact
-            impact = severity * vulnerability
+        elif event_type in ("supervolcano", "solar_flare"):
+            # Éruption volcanique: affecte plus les espèces terrestres (les plantes sont très affectées)
+            # Éruption solaire: affecte plus les espèces en surface
+            is_producer = np.array([species.trophic_level == TrophicLevel.PRODUCER for species in self.species])
+            vulnerability[is_producer] *= 1.5 if event_type == "supervolcano" else 1.3
             
-            # Application de l'impact
+        elif event_type == "pandemic":
+            # Pandémie: affecte plus les espèces sociales et complexes
+            vulnerability *= 0.5 + 0.5 * np.array([species.complexity for species in self.species])
+            is_social = np.array([species.intelligence > 0.5 for species in self.species])
+            vulnerability[is_social] *= 1.2  # Les espèces sociales sont plus vulnérables
+        
+        # Calcul de l'impact
+        impacts = (severity * vulnerability).tolist()
+        
+        # Application de l'impact à chaque espèce
+        for species, impact in zip(self.species, impacts):
             if impact > 0.8:
                 # Extinction possible
                 if random.random() < impact - 0.8:
@@ -27,6 +27,49 @@ class BiomeType(Enum):
     VOLCANIC = 11
     SWAMP = 12
 
+def _perlin_noise(grid_size, resolution, rng):
+    """
+    Génère une couche de bruit de Perlin 2D périodique (raccord sur les bords de la grille).
+    
+    Args:
+        grid_size: Taille de la grille générée.
+        resolution: Nombre de cellules de gradients par côté.
+        rng: Générateur NumPy utilisé pour tirer les gradients.
+    
+    Returns:
+        Carte de bruit de forme (grid_size, grid_size), valeurs environ dans [-1, 1].
+    """
+    # Gradients unitaires aléatoires aux nœuds du réseau (torique: le dernier nœud reboucle sur le premier)
+    angles = 2 * np.pi * rng.random((resolution, resolution))
+    gradient_x = np.cos(angles)
+    gradient_y = np.sin(angles)
+    
+    # Position de chaque ligne/colonne dans le réseau: cellule et coordonnée locale
+    position = np.arange(grid_size) * resolution / grid_size
+    cell = position.astype(np.intp)
+    local = position - cell
+    next_cell = (cell + 1) % resolution
+    
+    ty, tx = local[:, np.newaxis], local[np.newaxis, :]
+    
+    # Gradients des coins haut (y0) et bas (y1) de chaque ligne, puis de chaque cellule
+    # (deux take successifs, moins coûteux qu'une indexation 2D)
+    gx0, gy0 = gradient_x.take(cell, axis=0), gradient_y.take(cell, axis=0)
+    gx1, gy1 = gradient_x.take(next_cell, axis=0), gradient_y.take(next_cell, axis=0)
+    
+    # Produits scalaires gradient·distance aux quatre coins de la cellule
+    n00 = gx0.take(cell, axis=1) * tx + gy0.take(cell, axis=1) * ty
+    n10 = gx0.take(next_cell, axis=1) * (tx - 1) + gy0.take(next_cell, axis=1) * ty
+    n01 = gx1.take(cell, axis=1) * tx + gy1.take(cell, axis=1) * (ty - 1)
+    n11 = gx1.take(next_cell, axis=1) * (tx - 1) + gy1.take(next_cell, axis=1) * (ty - 1)
+    
+    # Interpolation avec la courbe de lissage quintique 6t^5 - 15t^4 + 10t^3
+    u = tx * tx * tx * (tx * (tx * 6 - 15) + 10)
+    v = ty * ty * ty * (ty * (ty * 6 - 15) + 10)
+    n0 = n00 + u * (n10 - n00)
+    n1 = n01 + u * (n11 - n01)
+    return np.sqrt(2) * (n0 + v * (n1 - n0))
+
 class Geography:
     """
     Classe gérant la géographie de la planète.
@@ -53,6 +96,7 @@ class Geography:
         self.moisture = None  # Humidité du sol
         self.temperature_base = None  # Température de base (avant effets climatiques)
         self.biomes = None  # Types de biomes
+        self.land_mask = None  # Cellules terrestres (biome au-delà des eaux peu profondes), lecture seule
         
         # Caractéristiques planétaires
         self.land_percentage = random.uniform(25, 75)  # % de terres émergées
@@ -78,6 +122,7 @@ class Geography:
         
         self.logger.info("Détermination des biomes...")
         self._determine_biomes()
+        self.update_land_mask()
         
         # Calcul des statistiques
         land_cells = np.sum(self.elevation > self.sea_level)
@@ -97,35 +142,30 @@ class Geography:
         octaves = 6
         persistence = 0.5
         lacunarity = 2.0
+        base_resolution = 4  # Cellules de gradients par côté pour la première octave (continents)
         
-        # Génération du bruit de Perlin (simulé avec plusieurs octaves de bruit)
+        # Génération du bruit de Perlin fractal (plusieurs octaves de bruit)
         for octave in range(octaves):
-            frequency = lacunarity ** octave
+            resolution = int(base_resolution * lacunarity ** octave)
             amplitude = persistence ** octave
             
-            # Génération d'une couche de bruit
-            noise_layer = np.zeros((self.grid_size, self.grid_size))
-            for y in range(self.grid_size):
-                for x in range(self.grid_size):
-                    # Utilisation de sin/cos pour simuler un bruit cohérent
-                    nx = x / self.grid_size * frequency
-                    ny = y / self.grid_size * frequency
-                    noise_value = (np.sin(nx * 10) * np.cos(ny * 10) + 
-                                  np.sin(nx * 20 + 5) * np.cos(ny * 20 + 3)) * 0.5 + 0.5
-                    noise_layer[y, x] = noise_value
+            # Les détails plus fins que deux cellules ne sont pas représentables sur la grille
+            if resolution > self.grid_size // 2:
+                break
             
             # Ajout de la couche à l'élévation totale
-            self.elevation += noise_layer * amplitude
+            self.elevation += _perlin_noise(self.grid_size, resolution, self.world.rng) * amplitude
         
-        # Normalisation entre 0 et 1
+        # Normalisation entre 0 et 1, stockée en simple précision (suffisante pour le terrain et
+        # deux fois moins de mémoire à parcourir)
         min_val = np.min(self.elevation)
         max_val = np.max(self.elevation)
-        self.elevation = (self.elevation - min_val) / (max_val - min_val)
+        self.elevation = ((self.elevation - min_val) / (max_val - min_val)).astype(np.float32)
         
-        # Ajustement pour obtenir le pourcentage de terres souhaité
-        sorted_elevations = np.sort(self.elevation.flatten())
-        target_index = int((1 - self.land_percentage / 100) * len(sorted_elevations))
-        self.sea_level = sorted_elevations[target_index]
+        # Ajustement pour obtenir le pourcentage de terres souhaité: seul l'élément de rang
+        # target_index est nécessaire, une sélection partielle suffit (pas de tri complet)
+        target_index = int((1 - self.land_percentage / 100) * self.elevation.size)
+        self.sea_level = np.partition(self.elevation.ravel(), target_index)[target_index]
     
     def _generate_moisture(self):
         """Génère la carte d'humidité."""
@@ -136,136 +176,122 @@ class Geography:
         octaves = 4
         persistence = 0.6
         lacunarity = 2.0
+        base_resolution = 6  # Masses d'air un peu plus fines que les continents
         
-        # Génération du bruit (simulé)
+        # Génération du bruit de Perlin fractal
         for octave in range(octaves):
-            frequency = lacunarity ** octave
+            resolution = int(base_resolution * lacunarity ** octave)
             amplitude = persistence ** octave
             
-            # Génération d'une couche de bruit
-            noise_layer = np.zeros((self.grid_size, self.grid_size))
-            for y in range(self.grid_size):
-                for x in range(self.grid_size):
-                    nx = x / self.grid_size * frequency
-                    ny = y / self.grid_size * frequency
-                    noise_value = (np.sin(nx * 15 + 2) * np.cos(ny * 15 + 7) + 
-                                  np.sin(nx * 30 + 10) * np.cos(ny * 30 + 5)) * 0.5 + 0.5
-                    noise_layer[y, x] = noise_value
+            # Les détails plus fins que deux cellules ne sont pas représentables sur la grille
+            if resolution > self.grid_size // 2:
+                break
             
             # Ajout de la couche à l'humidité totale
-            self.moisture += noise_layer * amplitude
+            self.moisture += _perlin_noise(self.grid_size, resolution, self.world.rng) * amplitude
         
         # Normalisation entre 0 et 1
         min_val = np.min(self.moisture)
         max_val = np.max(self.moisture)
-        self.moisture = (self.moisture - min_val) / (max_val - min_val)
-        
-        # Influence de la proximité de l'eau sur l'humidité
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                if self.elevation[y, x] > self.sea_level:  # Terre
-                    # Recherche de l'eau la plus proche
-                    min_dist = float('inf')
-                    for dy in range(-10, 11):
-                        for dx in range(-10, 11):
-                            nx, ny = (x + dx) % self.grid_size, (y + dy) % self.grid_size
-                            if self.elevation[ny, nx] <= self.sea_level:  # Eau
-                                dist = np.sqrt(dx**2 + dy**2)
-                                min_dist = min(min_dist, dist)
-                    
-                    # Influence de la distance à l'eau
-                    if min_dist < 10:
-                        moisture_boost = 1 - (min_dist / 10)
-                        self.moisture[y, x] = self.moisture[y, x] * 0.7 + moisture_boost * 0.3
+        self.moisture = ((self.moisture - min_val) / (max_val - min_val)).astype(np.float32)
+        
+        # Influence de la proximité de l'eau sur l'humidité: distance au carré de l'eau la plus
+        # proche (grille torique). Seuls les décalages à moins de 10 cellules comptent, 100
+        # signifie « pas d'eau assez proche »
+        water = self.elevation <= self.sea_level
+        min_dist_sq = np.full(water.shape, 100)
+        for dy in range(-9, 10):
+            water_rows = np.roll(water, -dy, axis=0)
+            for dx in range(-9, 10):
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < 100:
+                    nearby = np.roll(water_rows, -dx, axis=1)
+                    min_dist_sq[nearby & (min_dist_sq > dist_sq)] = dist_sq
+        
+        # Influence de la distance à l'eau sur les terres
+        boosted = ~water & (min_dist_sq < 100)
+        moisture_boost = 1 - (np.sqrt(min_dist_sq[boosted]) / 10)
+        self.moisture[boosted] = self.moisture[boosted] * 0.7 + moisture_boost * 0.3
     
     def _generate_base_temperature(self):
         """Génère la carte de température de base (avant effets climatiques)."""
-        # Initialisation de la matrice de température
-        self.temperature_base = np.zeros((self.grid_size, self.grid_size))
+        # Latitude normalisée de chaque ligne entre -1 (pôle sud) et 1 (pôle nord)
+        latitude = 2 * (np.arange(self.grid_size) / self.grid_size) - 1
         
-        # Température basée sur la latitude (plus chaud à l'équateur, plus froid aux pôles)
-        for y in range(self.grid_size):
-            # Latitude normalisée entre -1 (pôle sud) et 1 (pôle nord)
-            latitude = 2 * (y / self.grid_size) - 1
-            
-            # Température de base selon la latitude (courbe en cloche)
-            base_temp = 1 - latitude**2
-            
-            for x in range(self.grid_size):
-                self.temperature_base[y, x] = base_temp
+        # Température basée sur la latitude (plus chaud à l'équateur, plus froid aux pôles),
+        # selon une courbe en cloche, identique sur toute la ligne
+        base_temp = 1 - latitude**2
+        self.temperature_base = np.repeat(base_temp[:, np.newaxis], self.grid_size, axis=1)
         
-        # Influence de l'altitude sur la température
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                if self.elevation[y, x] > self.sea_level:
-                    # Plus l'altitude est élevée, plus il fait froid
-                    altitude_factor = (self.elevation[y, x] - self.sea_level) / (1 - self.sea_level)
-                    self.temperature_base[y, x] -= altitude_factor * 0.5
+        # Influence de l'altitude sur la température: plus l'altitude est élevée, plus il fait froid
+        land = self.elevation > self.sea_level
+        altitude_factor = (self.elevation[land] - self.sea_level) / (1 - self.sea_level)
+        self.temperature_base[land] -= altitude_factor * 0.5
         
         # Normalisation entre 0 et 1
         min_val = np.min(self.temperature_base)
         max_val = np.max(self.temperature_base)
-        self.temperature_base = (self.temperature_base - min_val) / (max_val - min_val)
+        self.temperature_base = ((self.temperature_base - min_val) / (max_val - min_val)).astype(np.float32)
     
     def _determine_biomes(self):
         """Détermine les biomes en fonction de l'élévation, l'humidité et la température."""
-        self.biomes = np.zeros((self.grid_size, self.grid_size), dtype=int)
-        
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                elevation = self.elevation[y, x]
-                moisture = self.moisture[y, x]
-                temperature = self.temperature_base[y, x]
-                
-                # Détermination du biome
-                if elevation <= self.sea_level:
-                    # Zones aquatiques
-                    if elevation > self.sea_level - 0.1:
-                        self.biomes[y, x] = BiomeType.SHALLOW_WATER.value
-                    else:
-                        self.biomes[y, x] = BiomeType.OCEAN.value
-                
-                elif elevation <= self.sea_level + 0.02:
-                    # Plages et côtes
-                    self.biomes[y, x] = BiomeType.BEACH.value
-                
-                elif elevation >= self.mountain_level:
-                    # Zones montagneuses
-                    if temperature < 0.2:
-                        self.biomes[y, x] = BiomeType.ICE.value
-                    else:
-                        self.biomes[y, x] = BiomeType.MOUNTAINS.value
-                        
-                        # Zones volcaniques (rares)
-                        if random.random() < 0.05 * self.tectonic_activity:
-                            self.biomes[y, x] = BiomeType.VOLCANIC.value
-                
-                else:
-                    # Autres biomes terrestres
-                    if temperature < 0.2:
-                        # Zones froides
-                        self.biomes[y, x] = BiomeType.TUNDRA.value
-                    
-                    elif temperature < 0.4:
-                        # Zones tempérées
-                        if moisture < 0.3:
-                            self.biomes[y, x] = BiomeType.PLAINS.value
-                        else:
-                            self.biomes[y, x] = BiomeType.FOREST.value
-                    
-                    else:
-                        # Zones chaudes
-                        if moisture < 0.2:
-                            self.biomes[y, x] = BiomeType.DESERT.value
-                        elif moisture < 0.5:
-                            self.biomes[y, x] = BiomeType.SAVANNA.value
-                        elif moisture < 0.8:
-                            self.biomes[y, x] = BiomeType.FOREST.value
-                        else:
-                            if temperature > 0.7:
-                                self.biomes[y, x] = BiomeType.JUNGLE.value
-                            else:
-                                self.biomes[y, x] = BiomeType.SWAMP.value
+        elevation = self.elevation
+        moisture = self.moisture
+        temperature = self.temperature_base
+        
+        # Classification de toutes les cellules à la fois: np.select retient la première condition
+        # vérifiée, dans l'ordre de priorité des cas
+        water = elevation <= self.sea_level
+        high = elevation >= self.mountain_level
+        cold = temperature < 0.2
+        temperate = temperature < 0.4
+        conditions = [
+            # Zones aquatiques
+            water & (elevation > self.sea_level - 0.1),
+            water,
+            # Plages et côtes
+            elevation <= self.sea_level + 0.02,
+            # Zones montagneuses
+            high & cold,
+            high,
+            # Zones froides
+            cold,
+            # Zones tempérées
+            temperate & (moisture < 0.3),
+            temperate,
+            # Zones chaudes
+            moisture < 0.2,
+            moisture < 0.5,
+            moisture < 0.8,
+            temperature > 0.7,
+        ]
+        choices = [
+            BiomeType.SHALLOW_WATER.value,
+            BiomeType.OCEAN.value,
+            BiomeType.BEACH.value,
+            BiomeType.ICE.value,
+            BiomeType.MOUNTAINS.value,
+            BiomeType.TUNDRA.value,
+            BiomeType.PLAINS.value,
+            BiomeType.FOREST.value,
+            BiomeType.DESERT.value,
+            BiomeType.SAVANNA.value,
+            BiomeType.FOREST.value,
+            BiomeType.JUNGLE.value,
+        ]
+        # Un octet suffit pour les 13 types de biomes
+        self.biomes = np.select(conditions, choices, default=BiomeType.SWAMP.value).astype(np.int8)
+        
+        # Zones volcaniques (rares): un tirage par cellule de montagne, dans l'ordre de la grille
+        mountain_cells = np.flatnonzero(self.biomes == BiomeType.MOUNTAINS.value)
+        draws = np.array([random.random() for _ in range(mountain_cells.size)])
+        self.biomes.ravel()[mountain_cells[draws < 0.05 * self.tectonic_activity]] = BiomeType.VOLCANIC.value
+    
+    def update_land_mask(self):
+        """Recalcule le masque des terres émergées après une modification des biomes."""
+        land_mask = self.biomes > BiomeType.SHALLOW_WATER.value
+        land_mask.flags.writeable = False
+        self.land_mask = land_mask
     
     def get_biome_name(self, biome_id):
         """Retourne le nom d'un biome à partir de son ID."""
@@ -276,9 +302,11 @@ class Geography:
         biome_counts = {}
         total_cells = self.grid_size * self.grid_size
         
+        # Comptage de tous les biomes en un seul passage sur la grille
+        counts = np.bincount(self.biomes.ravel(), minlength=len(BiomeType))
+        
         for biome_type in BiomeType:
-            count = np.sum(self.biomes == biome_type.value)
-            percentage = (count / total_cells) * 100
+            percentage = (counts[biome_type.value] / total_cells) * 100
             biome_counts[biome_type.name] = percentage
         
         return biome_counts
@@ -306,35 +334,53 @@ class Geography:
         event_type = "Éruption volcanique" if is_volcanic else "Tremblement de terre"
         self.logger.info(f"Événement tectonique: {event_type} d'intensité {intensity:.2f} aux coordonnées ({epicenter_x}, {epicenter_y})")
         
-        # Application des effets
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                # Distance à l'épicentre
-                dx = min(abs(x - epicenter_x), self.grid_size - abs(x - epicenter_x))
-                dy = min(abs(y - epicenter_y), self.grid_size - abs(y - epicenter_y))
-                distance = np.sqrt(dx**2 + dy**2)
-                
-                if distance <= impact_radius:
-                    # Effet décroissant avec la distance
-                    effect = (1 - distance / impact_radius) * intensity
-                    
-                    if is_volcanic and distance <= impact_radius / 3:
-                        # Création de zones volcaniques près de l'épicentre
-                        if self.elevation[y, x] > self.sea_level:
-                            self.biomes[y, x] = BiomeType.VOLCANIC.value
-                            
-                            # Augmentation de l'élévation
-                            self.elevation[y, x] = min(1.0, self.elevation[y, x] + effect * 0.2)
-                    
-                    elif effect > 0.5 and random.random() < effect * 0.3:
-                        # Modification aléatoire du terrain
-                        if self.elevation[y, x] > self.sea_level:
-                            # Possibilité de créer des fissures (eau)
-                            if random.random() < 0.1:
-                                self.elevation[y, x] = self.sea_level - 0.05
-                                self.biomes[y, x] = BiomeType.SHALLOW_WATER.value
-                        else:
-                            # Possibilité de faire émerger des terres
-                            if random.random() < 0.1:
-                                self.elevation[y, x] = self.sea_level + 0.05
-                                self.biomes[y, x] = BiomeType.BEACH.value
\ No newline at end of file
+        # Fenêtre carrée autour de l'épicentre (grille torique): seules ces cellules peuvent être
+        # touchées. Lignes et colonnes triées pour parcourir les cellules dans l'ordre de la grille
+        offsets = np.arange(-impact_radius, impact_radius + 1)
+        rows = np.unique((epicenter_y + offsets) % self.grid_size)
+        cols = np.unique((epicenter_x + offsets) % self.grid_size)
+        window = np.ix_(rows, cols)
+        
+        # Distance torique à l'épicentre
+        dy = np.abs(rows - epicenter_y)
+        dy = np.minimum(dy, self.grid_size - dy)
+        dx = np.abs(cols - epicenter_x)
+        dx = np.minimum(dx, self.grid_size - dx)
+        distance = np.sqrt(dy[:, np.newaxis]**2 + dx[np.newaxis, :]**2)
+        
+        # Effet décroissant avec la distance (indéfini pour un rayon nul: seul l'épicentre est touché)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            effect = (1 - distance / impact_radius) * intensity
+        
+        elevation = self.elevation[window]
+        biomes = self.biomes[window]
+        in_radius = distance <= impact_radius
+        land = elevation > self.sea_level
+        
+        # Création de zones volcaniques près de l'épicentre
+        volcanic_core = in_radius & (distance <= impact_radius / 3) if is_volcanic else np.zeros_like(in_radius)
+        uplift = volcanic_core & land
+        biomes[uplift] = BiomeType.VOLCANIC.value
+        
+        # Augmentation de l'élévation (fmin, comme min(), ignore un effet indéfini)
+        elevation[uplift] = np.fmin(1.0, elevation[uplift] + effect[uplift] * 0.2)
+        
+        # Modification aléatoire du terrain: tirages cellule par cellule, dans l'ordre de la grille
+        for y, x in zip(*np.nonzero(in_radius & ~volcanic_core & (effect > 0.5))):
+            if random.random() < effect[y, x] * 0.3:
+                if land[y, x]:
+                    # Possibilité de créer des fissures (eau)
+                    if random.random() < 0.1:
+                        elevation[y, x] = self.sea_level - 0.05
+                        biomes[y, x] = BiomeType.SHALLOW_WATER.value
+                else:
+                    # Possibilité de faire émerger des terres
+                    if random.random() < 0.1:
+                        elevation[y, x] = self.sea_level + 0.05
+                        biomes[y, x] = BiomeType.BEACH.value
+        
+        self.elevation[window] = elevation
+        self.biomes[window] = biomes
+        
+        # Mise à jour du masque des terres
+        self.update_land_mask()
\ No newline at end of file
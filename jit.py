@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Module d'accélération optionnelle pour la simulation Écosphère.
+Expose le décorateur njit de Numba lorsque celui-ci est installé.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Décorateur neutre utilisé lorsque Numba n'est pas disponible."""
+        # Utilisation directe: @njit
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        # Utilisation avec options: @njit(cache=True)
+        def decorator(func):
+            return func
+
+        return decorator
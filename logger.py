@@ -53,19 +53,19 @@ class EventLogger:
     
     def log_climate_event(self, region, event_type, severity, description):
         """Enregistre un événement climatique."""
-        self.logger.info(f"CLIMAT [{region}] - {event_type} (Sévérité: {severity}) - {description}")
+        self.logger.info("CLIMAT [%s] - %s (Sévérité: %s) - %s", region, event_type, severity, description)
     
     def log_species_event(self, species_name, event_type, description):
         """Enregistre un événement lié à une espèce."""
-        self.logger.info(f"ESPÈCE [{species_name}] - {event_type} - {description}")
+        self.logger.info("ESPÈCE [%s] - %s - %s", species_name, event_type, description)
     
     def log_evolution_event(self, species_name, mutation, advantage):
         """Enregistre un événement d'évolution."""
-        self.logger.info(f"ÉVOLUTION [{species_name}] - Mutation: {mutation} - Avantage: {advantage}")
+        self.logger.info("ÉVOLUTION [%s] - Mutation: %s - Avantage: %s", species_name, mutation, advantage)
     
     def log_civilization_event(self, civ_name, event_type, description):
         """Enregistre un événement de civilisation."""
-        self.logger.info(f"CIVILISATION [{civ_name}] - {event_type} - {description}")
+        self.logger.info("CIVILISATION [%s] - %s - %s", civ_name, event_type, description)
     
     def log_extinction(self, species_name, cause):
         """Enregistre l'extinction d'une espèce."""
@@ -73,4 +73,4 @@ class EventLogger:
     
     def log_technological_advancement(self, civ_name, tech_name, description):
         """Enregistre une avancée technologique."""
-        self.logger.info(f"TECHNOLOGIE [{civ_name}] - {tech_name} - {description}")
\ No newline at end of file
+        self.logger.info("TECHNOLOGIE [%s] - %s - %s", civ_name, tech_name, description)
\ No newline at end of file
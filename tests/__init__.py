@@ -0,0 +1,3 @@
+"""
+Tests du paquet simulation
+"""
\ No newline at end of file
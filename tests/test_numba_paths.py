@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests de cohérence entre les noyaux Numba et les chemins NumPy de repli.
+
+Chaque test exécute la même opération avec et sans Numba, à partir du même état
+(cartes et générateur aléatoire), et vérifie que les résultats concordent.
+
+Lancement depuis le dossier parent du paquet:
+    python -m unittest discover -s simulation/tests -t .
+"""
+
+import logging
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from simulation import civilization, climate, ecosystem
+from simulation.climate import WeatherType
+from simulation.jit import HAS_NUMBA
+from simulation.world import World
+
+logging.getLogger('ecosphere').setLevel(logging.ERROR)
+
+def _make_world(seed=5):
+    """Crée et génère un monde de test."""
+    world = World(seed=seed)
+    world.generate()
+    return world
+
+@unittest.skipUnless(HAS_NUMBA, "Numba n'est pas installé")
+class TestNumbaPaths(unittest.TestCase):
+    """Compare les chemins Numba et NumPy des calculs sur la grille."""
+    
+    def test_update_population(self):
+        """Les deux chemins de Species._update_population concordent pour toutes les espèces."""
+        world = _make_world()
+        ecosystem_ = world.ecosystem
+        ecosystem_.update_trophic_relationships()
+        self.assertTrue(any(species.predators for species in ecosystem_.species))
+        
+        for species in ecosystem_.species:
+            # Densité suffisante pour que croissance, prédation et migration comptent
+            species.population_map *= 1000
+            population_map = species.population_map.copy()
+            rng_state = world.rng.bit_generator.state
+            
+            results = []
+            for use_numba in (True, False):
+                species.population_map = population_map.copy()
+                world.rng.bit_generator.state = rng_state
+                with mock.patch.object(ecosystem, 'HAS_NUMBA', use_numba):
+                    species._update_population()
+                results.append((species.population_map, species.population))
+            
+            (numba_map, numba_population), (numpy_map, numpy_population) = results
+            self.assertEqual(numba_map.dtype, numpy_map.dtype)
+            np.testing.assert_allclose(numba_map, numpy_map, rtol=1e-5, atol=1e-3)
+            self.assertAlmostEqual(numba_population, numpy_population, delta=max(2, numpy_population * 1e-5))
+    
+    def test_apply_event_effects(self):
+        """Les deux chemins de Climate._apply_event_effects concordent pour tous les types d'événement."""
+        world = _make_world()
+        climate_ = world.climate
+        size = climate_.grid_size
+        
+        # Événements centrés près d'un bord pour couvrir le rebouclage de la grille
+        for index, event_type in enumerate(WeatherType):
+            event = {'type': event_type, 'x': (index * 37) % size, 'y': size - 3, 'radius': 8,
+                     'duration': 5, 'intensity': 0.9, 'days_active': 0}
+            fields = (climate_.temperature.copy(), climate_.precipitation.copy(),
+                      climate_.wind_strength.copy())
+            
+            results = []
+            for use_numba in (True, False):
+                climate_.temperature, climate_.precipitation, climate_.wind_strength = (
+                    field.copy() for field in fields)
+                with mock.patch.object(climate, 'HAS_NUMBA', use_numba):
+                    climate_._apply_event_effects(dict(event))
+                results.append((climate_.temperature, climate_.precipitation, climate_.wind_strength))
+            
+            for numba_field, numpy_field in zip(*results):
+                self.assertEqual(numba_field.dtype, numpy_field.dtype)
+                np.testing.assert_allclose(numba_field, numpy_field, rtol=0, atol=1e-6)
+    
+    def test_gain_territory_from(self):
+        """Les deux chemins de Civilization._gain_territory_from prennent les mêmes cellules."""
+        world = _make_world()
+        species = world.ecosystem.species
+        manager = world.civilization_manager
+        conqueror = manager.create_civilization(species[0])
+        defender = manager.create_civilization(species[1])
+        size = world.geography.grid_size
+        
+        # Territoires imbriqués et en partie partagés, traversant le bord de la grille
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            conqueror_territory = np.roll(rng.random((size, size)) < 0.02, -size // 8, axis=0)
+            defender_territory = np.zeros((size, size), dtype=bool)
+            defender_territory[:size // 8] = rng.random((size // 8, size)) < 0.5
+            defender_territory |= conqueror_territory & (rng.random((size, size)) < 0.5)
+            rng_state = world.rng.bit_generator.state
+            
+            results = []
+            for use_numba in (True, False):
+                conqueror.territory = conqueror_territory.copy()
+                defender.territory = defender_territory.copy()
+                conqueror._territory_changed()
+                defender._territory_changed()
+                world.rng.bit_generator.state = rng_state
+                with mock.patch.object(civilization, 'HAS_NUMBA', use_numba):
+                    conqueror._gain_territory_from(defender, 0.5)
+                results.append((conqueror.territory, defender.territory,
+                                conqueror.get_territory_size(), defender.get_territory_size()))
+            
+            (numba_own, numba_other, *numba_sizes), (numpy_own, numpy_other, *numpy_sizes) = results
+            np.testing.assert_array_equal(numba_own, numpy_own)
+            np.testing.assert_array_equal(numba_other, numpy_other)
+            self.assertEqual(numba_sizes, numpy_sizes)
+            self.assertEqual(numpy_sizes, [np.count_nonzero(numpy_own), np.count_nonzero(numpy_other)])
+
+if __name__ == '__main__':
+    unittest.main()
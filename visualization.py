@@ -523,19 +523,19 @@ class Visualizer:
         if hasattr(self.world, 'civilization_manager'):
             for civ in self.world.civilization_manager.civilizations:
                 if civ.history:
-                    recent_events.extend(civ.history[-5:])  # 5 derniers événements
+                    recent_events.extend(list(civ.history)[-5:])  # 5 derniers événements
         
         # Tri des événements par année
-        recent_events.sort(key=lambda e: e["year"])
+        recent_events.sort(key=lambda e: e.year)
         
         # Affichage des événements
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         
         for event in recent_events[-20:]:  # 20 événements les plus récents
-            year = event["year"]
-            event_type = event["type"]
-            description = event["description"]
+            year = event.year
+            event_type = event.type
+            description = event.description
             
             self.log_text.insert(tk.END, f"Année {year}: {event_type}\n")
             self.log_text.insert(tk.END, f"{description}\n\n")
@@ -1278,6 +1278,7 @@ class Visualizer:
                 
                 # Changement de biome
                 self.world.geography.biomes[y, x] = BiomeType.VOLCANIC.value
+                self.world.geography.update_land_mask()
                 
                 # Effet sur les cellules environnantes
                 radius = int(15 * intensity)
@@ -1317,7 +1318,7 @@ class Visualizer:
                         
                         if affected_cells > 0:
                             # Dégâts proportionnels au territoire affecté
-                            territory_percentage = affected_cells / np.sum(civ.territory)
+                            territory_percentage = affected_cells / civ.get_territory_size()
                             pop_loss = int(civ.population * territory_percentage * intensity * 0.3)
                             civ.population -= pop_loss
                             civ.stability -= intensity * 0.15 * territory_percentage
@@ -32,6 +32,7 @@ class World:
         self.seed = seed if seed is not None else random.randint(1, 1000000)
         random.seed(self.seed)
         np.random.seed(self.seed)
+        self.rng = np.random.default_rng(self.seed)  # Générateur NumPy pour les tirages groupés
         
         # Caractéristiques de base de la planète
         self.name = self._generate_planet_name()